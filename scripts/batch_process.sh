@@ -219,8 +219,9 @@ mkdir -p "$OUTPUT_DIR"
 
 # Construct the barnacle command to run for each manifest
 # {1} = manifest_url (one per line)
-# Output path is computed using SHA1 hash of the manifest URL
-BARNACLE_CMD="barnacle ocr {1} --model '$MODEL' --out '$OUTPUT_DIR/\$(echo -n {1} | sha1sum | cut -d\" \" -f1).jsonl' --resume"
+# Output path uses the same BLAKE2b-160 digest as the library's
+# manifest_output_path, so resume state is shared with `barnacle run`.
+BARNACLE_CMD="barnacle ocr {1} --model '$MODEL' --out '$OUTPUT_DIR/\$(python3 -c \"import hashlib, sys; print(hashlib.blake2b(sys.argv[1].encode(), digest_size=20).hexdigest())\" {1}).jsonl' --resume"
 
 # Build parallel options
 PARALLEL_OPTS=(
@@ -67,9 +67,11 @@ if [[ -z "$MANIFEST_URL" ]]; then
     exit 1
 fi
 
-# Compute output path using SHA1 hash of manifest URL
-SHA1_HASH=$(echo -n "$MANIFEST_URL" | sha1sum | cut -d' ' -f1)
-OUTPUT_PATH="${OUTPUT_DIR}/${SHA1_HASH}.jsonl"
+# Compute output path with the same BLAKE2b-160 digest the library uses
+# (barnacle.pipeline.output.manifest_output_path), so resume state is
+# shared with runs started via `barnacle run`.
+NAME_HASH=$(python3 -c 'import hashlib, sys; print(hashlib.blake2b(sys.argv[1].encode("utf-8"), digest_size=20).hexdigest())' "$MANIFEST_URL")
+OUTPUT_PATH="${OUTPUT_DIR}/${NAME_HASH}.jsonl"
 
 # =============================================================================
 # Log Job Info
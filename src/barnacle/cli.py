@@ -9,19 +9,31 @@ Commands:
 
 from __future__ import annotations
 
+import atexit
+import functools
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from csv import DictReader
 import json
+import os
 from pathlib import Path
 from typing import Any
 
 import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
-import httpx
+import mmap
+import orjson
+import sys
 import typer
 import logging
+from typing import TYPE_CHECKING
+
+# Annotation-only: httpx is imported lazily at first network use (here
+# and in the iiif loaders), so CLI startup never pays its import cost.
+if TYPE_CHECKING:
+    import httpx
 
-from barnacle.ocr import KrakenBackend, DEFAULT_MODEL
 from barnacle.iiif.v2 import (
     load_manifest,
     load_json,
@@ -30,58 +42,101 @@ from barnacle.iiif.v2 import (
     is_collection,
     is_manifest,
     iter_manifests,
+    iter_manifests_from_data,
+    iter_manifests_from_parsed,
     validate_manifest,
     validate_collection,
     validate_canvas,
 )
 from barnacle.pipeline.output import (
     page_key,
-    load_processed_keys,
+    load_processed_key_hashes,
     append_record,
+    discard_stale_sidecar,
     manifest_output_path,
 )
-from barnacle.pipeline.worker import process_manifest
-
 app = typer.Typer(add_completion=False, help="Barnacle MVP tooling")
 
+DEFAULT_FETCH_CONCURRENCY = 8  # mirrors barnacle.pipeline.worker
 DEFAULT_IIIF_SIZE = "!3000,3000"  # long-side constraint; good OCR/throughput tradeoff
 DEFAULT_IIIF_FORMAT = "jpg"
 DEFAULT_IIIF_QUALITY = "default"
 DEFAULT_IIIF_REGION = "full"
 DEFAULT_IIIF_ROTATION = "0"
 
+# LogRecord attributes that are not user-supplied extras; built once so
+# membership tests in the formatter hit a pre-hashed frozenset.
+_RESERVED_LOG_ATTRS = frozenset({
+    "name","msg","args","levelname","levelno","pathname","filename","module",
+    "exc_info","exc_text","stack_info","lineno","funcName","created","msecs",
+    "relativeCreated","thread","threadName","processName","process",
+})
+
+
 class JsonFormatter(logging.Formatter):
     """Simple JSON formatter for structured logs."""
-    def format(self, record: logging.LogRecord) -> str:
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        # record.created was captured when the record was made, so no extra
+        # clock_gettime syscall is needed per formatted line.
         payload: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(),
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
             "level": record.levelname,
             "msg": record.getMessage(),
             "logger": record.name,
         }
         # Include any custom attributes passed via `extra=`.
-        reserved = {
-            "name","msg","args","levelname","levelno","pathname","filename","module",
-            "exc_info","exc_text","stack_info","lineno","funcName","created","msecs",
-            "relativeCreated","thread","threadName","processName","process",
-        }
         for k, v in record.__dict__.items():
-            if k in reserved or k.startswith("_"):
+            if k in _RESERVED_LOG_ATTRS or k.startswith("_"):
                 continue
-            try:
-                json.dumps(v)
+            # Scalars are serializable by construction: a type-tag check
+            # suffices. Only containers need a trial serialization, since
+            # they may hold arbitrary values.
+            if isinstance(v, (str, int, float, bool)) or v is None:
                 payload[k] = v
-            except TypeError:
+            elif isinstance(v, (list, tuple, dict)):
+                try:
+                    orjson.dumps(v, option=orjson.OPT_NON_STR_KEYS)
+                    payload[k] = v
+                except (TypeError, ValueError):
+                    payload[k] = repr(v)
+            else:
                 payload[k] = repr(v)
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=False)
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self.format_bytes(record).decode()
+
+
+class JsonLinesHandler(logging.StreamHandler):
+    """
+    Stream handler that emits pre-encoded JSON bytes.
+
+    Writing through the stream's underlying binary buffer skips the
+    TextIOWrapper's per-write UTF-8 encode and lock; the formatter output
+    is already UTF-8 JSON.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            formatter = self.formatter
+            buffer = getattr(self.stream, "buffer", None)
+            if isinstance(formatter, JsonFormatter) and buffer is not None:
+                buffer.write(formatter.format_bytes(record) + b"\n")
+                self.flush()
+            else:
+                super().emit(record)
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(level: str) -> logging.Logger:
     logger = logging.getLogger("barnacle")
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
-    handler = logging.StreamHandler()
+    handler = JsonLinesHandler()
     handler.setFormatter(JsonFormatter())
     logger.handlers[:] = [handler]
     logger.propagate = False
@@ -91,18 +146,136 @@ def setup_logging(level: str) -> logging.Logger:
 LOGGER = logging.getLogger("barnacle")
 
 
+# Shared HTTP client. Constructing a client per request discards connection
+# pooling, TLS session resumption, and HTTP/2 multiplexing between fetches,
+# which matters when a collection fans out to many manifests on one host.
+_CLIENT: httpx.Client | None = None
+
+
+def _client() -> httpx.Client:
+    """Return the lazily-initialized module-level HTTP client."""
+    global _CLIENT
+    if _CLIENT is None:
+        import httpx
+
+        _CLIENT = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+        atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
 def fetch_manifest(url: str) -> dict[str, Any]:
     """Fetch manifest from URL (backward compatibility helper)."""
-    with httpx.Client(timeout=10.0, follow_redirects=True) as client:
-        resp = client.get(url)
-        resp.raise_for_status()
-        return resp.json()
+    resp = _client().get(url)
+    resp.raise_for_status()
+    return resp.json()
+
+
 def fetch_bytes(url: str, *, timeout: float = 30.0) -> bytes:
     """Fetch binary content from URL."""
-    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-        resp = client.get(url)
-        resp.raise_for_status()
-        return resp.content
+    resp = _client().get(url, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content
+
+
+@dataclass
+class BatchSummary:
+    """Aggregate results of a parallel manifest batch."""
+
+    total_pages: int = 0
+    failed_manifests: list[str] = field(default_factory=list)
+
+
+def _run_batch(
+    tasks: list[tuple[str, Path]],
+    worker_kwargs: dict[str, Any],
+    *,
+    workers: int,
+    show_output: bool = False,
+    processed_keys: set[int] | None = None,
+) -> BatchSummary:
+    """
+    Process (manifest_id, output_path) tasks on a process pool.
+
+    Shared by run_cmd and ocr_cmd: submits one process_manifest future per
+    task, streams per-manifest progress as futures complete, and returns
+    the aggregate summary. worker_kwargs are forwarded to process_manifest
+    alongside each task's manifest_id/output_path.
+
+    processed_keys is the batch-wide resume set for tasks sharing one
+    output file (ocr_cmd). It is shipped once per worker process through
+    the pool initializer; putting it in worker_kwargs instead would
+    pickle the whole set again for every submitted manifest.
+    """
+    from barnacle.pipeline.worker import process_manifest, _init_worker
+
+    # Progress output goes through direct stream writes, flushed once per
+    # manifest instead of typer.echo's write+flush per line.
+    out = sys.stdout
+    err = sys.stderr
+    summary = BatchSummary()
+    total = len(tasks)
+    completed = 0
+
+    # Clear stale .keys sidecars once, before any worker opens them;
+    # per-writer cleanup would race on shared output files.
+    for output_path in dict.fromkeys(output_path for _, output_path in tasks):
+        discard_stale_sidecar(output_path)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(processed_keys,),
+    ) as executor:
+        futures = {
+            executor.submit(
+                process_manifest,
+                manifest_id=manifest_id,
+                output_path=output_path,
+                **worker_kwargs,
+            ): (manifest_id, output_path)
+            for manifest_id, output_path in tasks
+        }
+
+        for future in as_completed(futures):
+            manifest_id, output_path = futures[future]
+            completed += 1
+            result = future.result()
+
+            out.write(f"\n📄 [{completed}/{total}] {manifest_id}\n")
+
+            # Report results
+            if result.validation_issues:
+                err.write(
+                    f"⚠️  Validation issues ({len(result.validation_issues)}), but processing continued:\n"
+                )
+                for issue in result.validation_issues[:5]:  # Show first 5
+                    err.write(f"  - {issue.path}: {issue.message}\n")
+                if len(result.validation_issues) > 5:
+                    err.write(f"  ... and {len(result.validation_issues) - 5} more\n")
+                err.flush()
+
+            if result.success:
+                summary.total_pages += result.pages_processed
+                out.write(
+                    f"✅ Completed: {result.pages_processed} pages processed, "
+                    f"{result.pages_skipped} skipped, "
+                    f"{result.pages_failed} failed "
+                    f"({result.elapsed_seconds:.1f}s)\n"
+                )
+                if show_output:
+                    out.write(f"   Output: {output_path}\n")
+            else:
+                summary.failed_manifests.append(manifest_id)
+                err.write("❌ Failed to process manifest\n")
+                err.flush()
+            out.flush()
+
+    return summary
 
 
 @app.command("validate")
@@ -113,11 +286,14 @@ def validate_cmd(
     ),
 ) -> None:
     """Validate a IIIF Presentation 2.x manifest or collection against pipeline requirements."""
+    # Load the root JSON exactly once and reuse it for the type check,
+    # collection validation, and manifest traversal below.
     data = load_json(manifest_or_collection)
     all_issues = []
+    collection = None
 
     # If root is a Collection, validate its structure first
-    if is_collection(manifest_or_collection):
+    if data.get("@type") == "sc:Collection":
         collection = parse_collection(data)
         collection_issues = validate_collection(collection)
         if collection_issues:
@@ -139,7 +315,12 @@ def validate_cmd(
 
     # Validate each manifest (works for both single manifests and collections)
     try:
-        for manifest_id, manifest in iter_manifests(manifest_or_collection):
+        manifest_iter = (
+            iter_manifests_from_parsed(collection)
+            if collection is not None
+            else iter_manifests_from_data(data)
+        )
+        for manifest_id, manifest in manifest_iter:
             issues = validate_manifest(manifest)
             if issues:
                 all_issues.append((manifest_id, issues))
@@ -163,6 +344,8 @@ def validate_all_cmd(
     path_to_csv_file: str = typer.Argument(..., help="Path to Figgy report"),
 ) -> None:
     """Validate a table of IIIF Presentation 2.x manifests against pipeline requirements."""
+    import httpx
+
     with Path(path_to_csv_file).open('r') as csv_file:
         reader: DictReader = DictReader(csv_file)
         for row in reader:
@@ -191,17 +374,28 @@ def run_cmd(
     cache_dir: Path = typer.Option(
         Path(".barnacle-cache"), "--cache-dir", help="Cache directory for downloaded images"
     ),
+    workers: int = typer.Option(
+        os.cpu_count(), "--workers", help="Number of parallel worker processes"
+    ),
+    fetch_concurrency: int = typer.Option(
+        DEFAULT_FETCH_CONCURRENCY, "--fetch-concurrency",
+        help="Image downloads kept in flight ahead of OCR, per manifest"
+    ),
     log_level: str = typer.Option("INFO", "--log-level", help="Log level"),
 ) -> None:
     """
     Run OCR on a list of manifests.
 
     Reads manifest URLs from MANIFEST_LIST (one per line) and writes
-    JSONL output files to OUTPUT_DIR (one file per manifest, SHA1-named).
+    JSONL output files to OUTPUT_DIR (one file per manifest, named by a
+    BLAKE2b-160 hash of the manifest URL).
 
     Example:
         barnacle run manifests.txt output/ --max-pages 5
     """
+    # Deferred: pulls in the OCR stack, which non-OCR commands never need.
+    from barnacle.ocr import DEFAULT_MODEL
+
     global LOGGER
     LOGGER = setup_logging(log_level)
 
@@ -215,18 +409,32 @@ def run_cmd(
         typer.echo(f"Error: Manifest list file not found: {manifest_list}", err=True)
         raise typer.Exit(code=1)
 
-    # Read manifest URLs from file
-    manifest_urls = []
-    with manifest_list.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                manifest_urls.append(line)
+    # Read manifest URLs from file. mmap lets the kernel page cache back
+    # the scan directly — mm.readline walks the mapping in C without
+    # copying the whole file into a bytes object first — and
+    # comment/blank lines are filtered at the bytes level so only
+    # surviving lines pay for a UTF-8 decode.
+    manifest_urls: list[str] = []
+    if manifest_list.stat().st_size > 0:
+        with open(manifest_list, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                manifest_urls = [
+                    line.decode("utf-8")
+                    for raw in iter(mm.readline, b"")
+                    if (line := raw.strip()) and not line.startswith(b"#")
+                ]
 
     if not manifest_urls:
         typer.echo("Error: No manifest URLs found in file", err=True)
         raise typer.Exit(code=1)
 
+    # Deduplicate (order-preserving): duplicate URLs would redo the work
+    # and race on the same output file.
+    unique_urls = list(dict.fromkeys(manifest_urls))
+    if len(unique_urls) < len(manifest_urls):
+        typer.echo(f"Skipping {len(manifest_urls) - len(unique_urls)} duplicate manifest URL(s)")
+        manifest_urls = unique_urls
+
     typer.echo(f"Found {len(manifest_urls)} manifest(s) to process")
 
     # Create output directory
@@ -236,72 +444,57 @@ def run_cmd(
     effective_model = model if model else DEFAULT_MODEL
     typer.echo(f"Using model: {effective_model}")
 
-    # Process each manifest
-    manifest_count = 0
-    total_pages = 0
+    # Build the task list up front, skipping outputs that already exist
+    # (resume behavior) so workers are not wasted on completed manifests.
+    manifest_count = len(manifest_urls)
     skipped_manifests = 0
-    failed_manifests = []
 
-    for manifest_url in manifest_urls:
-        manifest_count += 1
+    # One directory scan instead of a stat() per manifest; on networked
+    # filesystems N stat calls dominate the skip check for large lists.
+    existing = {entry.name for entry in os.scandir(output_dir)}
 
-        # Generate output path using SHA1
-        output_path = manifest_output_path(manifest_url, output_dir)
+    # Memoize the hash-based path derivation so a URL is hashed at most
+    # once, even if it appears multiple times in the list.
+    @functools.lru_cache(maxsize=None)
+    def _out_path(url: str) -> Path:
+        return manifest_output_path(url, output_dir)
 
-        # Skip if output file already exists (resume behavior)
-        if output_path.exists():
-            typer.echo(f"⏭️  [{manifest_count}/{len(manifest_urls)}] Skipping (already exists): {output_path.name}")
+    tasks: list[tuple[str, Path]] = []
+    for manifest_url in manifest_urls:
+        output_path = _out_path(manifest_url)
+
+        if output_path.name in existing:
+            typer.echo(f"⏭️  Skipping (already exists): {output_path.name}")
             skipped_manifests += 1
             continue
 
-        typer.echo(f"\n📄 [{manifest_count}/{len(manifest_urls)}] Processing: {manifest_url}")
-
-        # Process manifest
-        result = process_manifest(
-            manifest_id=manifest_url,
-            output_path=output_path,
-            model=effective_model,
-            cache_dir=cache_dir,
-            max_pages=max_pages,
-            resume=True,
-        )
-
-        # Report results
-        if result.validation_issues:
-            typer.echo(
-                f"⚠️  Validation issues ({len(result.validation_issues)}), but processing continued:",
-                err=True
-            )
-            for issue in result.validation_issues[:5]:
-                typer.echo(f"  - {issue.path}: {issue.message}", err=True)
-            if len(result.validation_issues) > 5:
-                typer.echo(f"  ... and {len(result.validation_issues) - 5} more", err=True)
-
-        if result.success:
-            total_pages += result.pages_processed
-            typer.echo(
-                f"✅ Completed: {result.pages_processed} pages processed, "
-                f"{result.pages_skipped} skipped, "
-                f"{result.pages_failed} failed "
-                f"({result.elapsed_seconds:.1f}s)"
-            )
-            typer.echo(f"   Output: {output_path}")
-        else:
-            failed_manifests.append(manifest_url)
-            typer.echo(f"❌ Failed to process manifest", err=True)
+        tasks.append((manifest_url, output_path))
+
+    summary = _run_batch(
+        tasks,
+        {
+            "model": effective_model,
+            "cache_dir": cache_dir,
+            "max_pages": max_pages,
+            "resume": True,
+            "fetch_concurrency": fetch_concurrency,
+        },
+        workers=workers,
+        show_output=True,
+    )
 
     # Final summary
     typer.echo(f"\n{'='*60}")
     typer.echo(f"📊 Summary:")
-    typer.echo(f"  Manifests processed: {manifest_count - skipped_manifests - len(failed_manifests)}")
+    typer.echo(f"  Manifests processed: {manifest_count - skipped_manifests - len(summary.failed_manifests)}")
     typer.echo(f"  Manifests skipped (already exist): {skipped_manifests}")
-    typer.echo(f"  Manifests failed: {len(failed_manifests)}")
-    typer.echo(f"  Total pages: {total_pages}")
+    typer.echo(f"  Manifests failed: {len(summary.failed_manifests)}")
+    typer.echo(f"  Total pages: {summary.total_pages}")
     typer.echo(f"  Output directory: {output_dir}")
 
-    if failed_manifests:
-        typer.echo(f"\n❌ Failed manifests ({len(failed_manifests)}):")
-        for manifest_url in failed_manifests:
+    if summary.failed_manifests:
+        typer.echo(f"\n❌ Failed manifests ({len(summary.failed_manifests)}):")
+        for manifest_url in summary.failed_manifests:
             typer.echo(f"  - {manifest_url}")
         raise typer.Exit(code=1)
 
@@ -346,6 +539,13 @@ def ocr_cmd(
         True, "--model-auto-install/--no-model-auto-install",
         help="If model looks like a DOI, run `kraken get` first"
     ),
+    workers: int = typer.Option(
+        os.cpu_count(), "--workers", help="Number of parallel worker processes"
+    ),
+    fetch_concurrency: int = typer.Option(
+        DEFAULT_FETCH_CONCURRENCY, "--fetch-concurrency",
+        help="Image downloads kept in flight ahead of OCR, per manifest"
+    ),
 ) -> None:
     """
     Run Kraken OCR over a IIIF v2 manifest (or collection of manifests) and write JSONL output.
@@ -363,66 +563,56 @@ def ocr_cmd(
     out = out.expanduser()
     cache_dir = cache_dir.expanduser()
 
-    # Process manifests
-    manifest_count = 0
-    total_pages = 0
-    failed_manifests = []
-
-    for manifest_id, manifest in iter_manifests(manifest_or_collection):
-        manifest_count += 1
-        typer.echo(f"\n📄 Processing manifest {manifest_count}: {manifest_id}")
-
-        # Use pipeline worker for single manifest processing
-        result = process_manifest(
-            manifest_id=manifest_id,
-            output_path=out,
-            model=model,
-            cache_dir=cache_dir,
-            max_pages=max_pages,
-            resume=resume,
-            size=size,
-            fmt=fmt,
-            quality=quality,
-            region=region,
-            rotation=rotation,
-            source_metadata_id=source_metadata_id,
-            ark=ark,
-            model_auto_install=model_auto_install,
-        )
-
-        # Report results
-        if result.validation_issues:
-            typer.echo(
-                f"⚠️  Validation issues ({len(result.validation_issues)}), but processing continued:",
-                err=True
-            )
-            for issue in result.validation_issues[:5]:  # Show first 5
-                typer.echo(f"  - {issue.path}: {issue.message}", err=True)
-            if len(result.validation_issues) > 5:
-                typer.echo(f"  ... and {len(result.validation_issues) - 5} more", err=True)
-
-        if result.success:
-            total_pages += result.pages_processed
-            typer.echo(
-                f"✅ Completed: {result.pages_processed} pages processed, "
-                f"{result.pages_skipped} skipped, "
-                f"{result.pages_failed} failed "
-                f"({result.elapsed_seconds:.1f}s)"
-            )
-        else:
-            failed_manifests.append(manifest_id)
-            typer.echo(f"❌ Failed to process manifest", err=True)
+    # Resolve manifest IDs up front so the processing fan-out is a simple
+    # list of independent tasks.
+    manifest_ids = [manifest_id for manifest_id, _manifest in iter_manifests(manifest_or_collection)]
+    # Deduplicate (order-preserving): a manifest listed in several nested
+    # collections should only be processed once.
+    manifest_ids = list(dict.fromkeys(manifest_ids))
+    manifest_count = len(manifest_ids)
+
+    # Load the resume state once and share it: every manifest appends to the
+    # same output file, so re-scanning the JSONL per manifest would be
+    # O(manifests x pages). _run_batch ships the set once per worker
+    # process (pool initializer), not once per submitted manifest.
+    processed_keys = (
+        load_processed_key_hashes(out) if resume and out.exists() else set()
+    )
+
+    # Process manifests in parallel via the pipeline worker. Each worker's
+    # JsonlWriter emits whole checkpoints as single O_APPEND writes, so
+    # concurrent workers can share the output without interleaving lines.
+    summary = _run_batch(
+        [(manifest_id, out) for manifest_id in manifest_ids],
+        {
+            "model": model,
+            "cache_dir": cache_dir,
+            "max_pages": max_pages,
+            "resume": resume,
+            "size": size,
+            "fmt": fmt,
+            "quality": quality,
+            "region": region,
+            "rotation": rotation,
+            "source_metadata_id": source_metadata_id,
+            "ark": ark,
+            "model_auto_install": model_auto_install,
+            "fetch_concurrency": fetch_concurrency,
+        },
+        workers=workers,
+        processed_keys=processed_keys,
+    )
 
     # Final summary
     typer.echo(f"\n{'='*60}")
     typer.echo(f"📊 Summary:")
     typer.echo(f"  Manifests processed: {manifest_count}")
-    typer.echo(f"  Total pages: {total_pages}")
+    typer.echo(f"  Total pages: {summary.total_pages}")
     typer.echo(f"  Output: {out}")
 
-    if failed_manifests:
-        typer.echo(f"\n❌ Failed manifests ({len(failed_manifests)}):")
-        for manifest_id in failed_manifests:
+    if summary.failed_manifests:
+        typer.echo(f"\n❌ Failed manifests ({len(summary.failed_manifests)}):")
+        for manifest_id in summary.failed_manifests:
             typer.echo(f"  - {manifest_id}")
         raise typer.Exit(code=1)
 
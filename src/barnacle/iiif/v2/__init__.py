@@ -37,9 +37,11 @@ from .loaders import (
     load_manifest,
     load_collection,
     load_json,
+    load_bytes,
     parse_manifest,
     parse_collection,
     fetch_json,
+    fetch_bytes,
 )
 from .validation import (
     ValidationIssue,
@@ -48,7 +50,11 @@ from .validation import (
     validate_canvas,
 )
 from .traversal import (
+    aiter_manifests,
+    iter_manifest_ids,
     iter_manifests,
+    iter_manifests_from_data,
+    iter_manifests_from_parsed,
     is_collection,
     is_manifest,
 )
@@ -66,16 +72,22 @@ __all__ = [
     "load_manifest",
     "load_collection",
     "load_json",
+    "load_bytes",
     "parse_manifest",
     "parse_collection",
     "fetch_json",
+    "fetch_bytes",
     # Validation
     "ValidationIssue",
     "validate_manifest",
     "validate_collection",
     "validate_canvas",
     # Traversal
+    "aiter_manifests",
+    "iter_manifest_ids",
     "iter_manifests",
+    "iter_manifests_from_data",
+    "iter_manifests_from_parsed",
     "is_collection",
     "is_manifest",
 ]
@@ -7,13 +7,61 @@ into Pydantic models.
 
 from __future__ import annotations
 
+import atexit
 from pathlib import Path
-from typing import Any
-import json
+from typing import TYPE_CHECKING, Any
 
-import httpx
+import orjson
 
-from .models import Manifest, Collection
+if TYPE_CHECKING:
+    import httpx
+
+from .models import (
+    Annotation,
+    Canvas,
+    Collection,
+    ImageResource,
+    ImageService,
+    Manifest,
+    Sequence,
+    _MANIFEST_VALIDATOR,
+    _COLLECTION_VALIDATOR,
+)
+
+
+_URL_SCHEMES = ("http://", "https://")
+
+# Shared client so repeated fetches (e.g. every child manifest in a
+# collection) reuse keepalive connections instead of paying a TCP+TLS
+# handshake per request. Created lazily so importing the package never
+# opens sockets — and httpx itself is imported only here, on first
+# network use, so file-only and non-network CLI paths skip its import
+# cost at startup.
+_CLIENT: httpx.Client | None = None
+
+
+def _client() -> httpx.Client:
+    """Return the shared pooled HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        import httpx
+
+        _CLIENT = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+        atexit.register(close_clients)
+    return _CLIENT
+
+
+def close_clients() -> None:
+    """Close the shared HTTP client (registered atexit; safe to call twice)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        _CLIENT.close()
+        _CLIENT = None
 
 
 def fetch_json(url: str, *, timeout: float = 10.0) -> dict[str, Any]:
@@ -31,10 +79,58 @@ def fetch_json(url: str, *, timeout: float = 10.0) -> dict[str, Any]:
         httpx.HTTPError: If request fails
         json.JSONDecodeError: If response is not valid JSON
     """
-    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-        resp = client.get(url)
+    # stream + read() assembles the body into one buffer sized from
+    # Content-Length when available, instead of the chunk-list reassembly
+    # resp.json() goes through on multi-MB manifests.
+    with _client().stream("GET", url, timeout=timeout) as resp:
         resp.raise_for_status()
-        return resp.json()
+        raw = resp.read()
+    # orjson decodes straight from the response bytes; its
+    # JSONDecodeError subclasses json.JSONDecodeError, so existing
+    # callers keep working.
+    return orjson.loads(raw)
+
+
+def fetch_bytes(url: str, *, timeout: float = 10.0) -> bytes:
+    """
+    Fetch raw bytes from URL.
+
+    Fast path for callers that validate JSON directly from bytes (see
+    load_manifest/load_collection) without materializing a dict first.
+
+    Parameters:
+        url: HTTP(S) URL to fetch
+        timeout: Request timeout in seconds
+
+    Returns:
+        Response body as bytes
+
+    Raises:
+        httpx.HTTPError: If request fails
+    """
+    resp = _client().get(url, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content
+
+
+def load_bytes(path_or_url: str) -> bytes:
+    """
+    Load raw bytes from file path or URL.
+
+    Parameters:
+        path_or_url: File path or URL
+
+    Returns:
+        Raw content as bytes
+
+    Raises:
+        FileNotFoundError: If file path doesn't exist
+        httpx.HTTPError: If URL fetch fails
+    """
+    if path_or_url.startswith(_URL_SCHEMES):
+        return fetch_bytes(path_or_url)
+
+    return Path(path_or_url).expanduser().read_bytes()
 
 
 def load_json(path_or_url: str) -> dict[str, Any]:
@@ -59,25 +155,108 @@ def load_json(path_or_url: str) -> dict[str, Any]:
         >>> data = load_json("https://example.org/manifest.json")
         >>> data = load_json("/path/to/manifest.json")
     """
-    if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
+    if path_or_url.startswith(_URL_SCHEMES):
         return fetch_json(path_or_url)
 
     p = Path(path_or_url).expanduser()
-    return json.loads(p.read_text(encoding="utf-8"))
+    # Read bytes and let orjson handle UTF-8: skips the str decode pass
+    # that read_text() + json.loads() would do.
+    return orjson.loads(p.read_bytes())
 
 
-def parse_manifest(data: dict[str, Any]) -> Manifest:
+def _construct_service(data: Any) -> ImageService | list[ImageService] | None:
+    """Build ImageService model(s) from raw service JSON without validation.
+
+    Mirrors the model's id normalization (trailing-slash strip), which
+    model_construct would otherwise bypass.
+    """
+    if data is None:
+        return None
+    if isinstance(data, list):
+        return [
+            ImageService.model_construct(
+                id=(s.get("@id") or "").rstrip("/"),
+                type=s.get("@type"),
+                profile=s.get("profile"),
+                context=s.get("@context"),
+            )
+            for s in data
+        ]
+    return ImageService.model_construct(
+        id=(data.get("@id") or "").rstrip("/"),
+        type=data.get("@type"),
+        profile=data.get("profile"),
+        context=data.get("@context"),
+    )
+
+
+def _construct_canvas(data: dict[str, Any]) -> Canvas:
+    """Build a Canvas model tree from raw JSON without validation."""
+    images = [
+        Annotation.model_construct(
+            id=a.get("@id"),
+            type=a.get("@type"),
+            motivation=a.get("motivation"),
+            on=a.get("on"),
+            resource=ImageResource.model_construct(
+                id=(r := a.get("resource", {})).get("@id"),
+                type=r.get("@type"),
+                format=r.get("format"),
+                width=r.get("width"),
+                height=r.get("height"),
+                service=_construct_service(r.get("service")),
+            ),
+        )
+        for a in data.get("images", [])
+    ]
+    return Canvas.model_construct(
+        id=data.get("@id"),
+        type=data.get("@type"),
+        label=data.get("label"),
+        width=data.get("width"),
+        height=data.get("height"),
+        images=images,
+    )
+
+
+def _construct_manifest(data: dict[str, Any]) -> Manifest:
+    """Build a Manifest model tree from raw JSON without validation."""
+    sequences = [
+        Sequence.model_construct(
+            id=s.get("@id"),
+            type=s.get("@type"),
+            canvases=[_construct_canvas(c) for c in s.get("canvases", [])],
+        )
+        for s in data.get("sequences", [])
+    ]
+    return Manifest.model_construct(
+        id=data.get("@id"),
+        type=data.get("@type"),
+        label=data.get("label"),
+        metadata=data.get("metadata"),
+        sequences=sequences,
+    )
+
+
+def parse_manifest(data: dict[str, Any], *, validate: bool = True) -> Manifest:
     """
     Parse manifest dict into Pydantic model.
 
     Parameters:
         data: Manifest JSON as dictionary
+        validate: When False, skip pydantic validation and construct the
+            model tree directly via model_construct. Roughly an order of
+            magnitude faster; only safe for manifests from a trusted
+            repository. Unknown extra keys are dropped on this path, and
+            malformed input surfaces later as attribute errors instead of
+            ValidationError
 
     Returns:
         Manifest model
 
     Raises:
         pydantic.ValidationError: If JSON doesn't match manifest schema
+            (validate=True only)
 
     Example:
         >>> data = load_json(url)
@@ -85,7 +264,11 @@ def parse_manifest(data: dict[str, Any]) -> Manifest:
         >>> for canvas in manifest.canvases():
         ...     print(canvas.id)
     """
-    return Manifest.model_validate(data)
+    if not validate:
+        return _construct_manifest(data)
+    # Calls the precompiled SchemaValidator directly; same semantics as
+    # Manifest.model_validate without the classmethod wrapper per call.
+    return _MANIFEST_VALIDATOR.validate_python(data)
 
 
 def parse_collection(data: dict[str, Any]) -> Collection:
@@ -107,7 +290,9 @@ def parse_collection(data: dict[str, Any]) -> Collection:
         >>> for manifest_id in collection.manifest_ids():
         ...     print(manifest_id)
     """
-    return Collection.model_validate(data)
+    # Calls the precompiled SchemaValidator directly; same semantics as
+    # Collection.model_validate without the classmethod wrapper per call.
+    return _COLLECTION_VALIDATOR.validate_python(data)
 
 
 def load_manifest(path_or_url: str) -> Manifest:
@@ -133,8 +318,9 @@ def load_manifest(path_or_url: str) -> Manifest:
         >>> print(manifest.id)
         >>> print(len(manifest.canvases()))
     """
-    data = load_json(path_or_url)
-    return parse_manifest(data)
+    # model_validate_json parses and validates in one pass inside
+    # pydantic-core, skipping the intermediate Python dict.
+    return Manifest.model_validate_json(load_bytes(path_or_url))
 
 
 def load_collection(path_or_url: str) -> Collection:
@@ -160,5 +346,6 @@ def load_collection(path_or_url: str) -> Collection:
         >>> print(collection.id)
         >>> print(len(collection.manifest_ids()))
     """
-    data = load_json(path_or_url)
-    return parse_collection(data)
+    # model_validate_json parses and validates in one pass inside
+    # pydantic-core, skipping the intermediate Python dict.
+    return Collection.model_validate_json(load_bytes(path_or_url))
@@ -9,7 +9,7 @@ needed for Barnacle's OCR pipeline.
 from __future__ import annotations
 
 from typing import Any, Literal
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, field_validator
 
 
 class ImageService(BaseModel):
@@ -27,6 +27,13 @@ class ImageService(BaseModel):
     profile: str | list[Any] | None = None
     context: str | list[Any] | None = Field(default=None, alias="@context")
 
+    @field_validator("id", mode="after")
+    @classmethod
+    def _strip_trailing_slash(cls, v: str) -> str:
+        # Normalize once at build time so image_url() doesn't rstrip-scan
+        # the id on every call.
+        return v.rstrip("/")
+
     def image_url(
         self,
         *,
@@ -54,8 +61,7 @@ class ImageService(BaseModel):
             >>> service.image_url(size="200,200", fmt="png")
             'https://iiif.example.org/image1/full/200,200/0/default.png'
         """
-        base = self.id.rstrip("/")
-        return f"{base}/{region}/{size}/{rotation}/{quality}.{fmt}"
+        return f"{self.id}/{region}/{size}/{rotation}/{quality}.{fmt}"
 
 
 class ImageResource(BaseModel):
@@ -110,6 +116,10 @@ class Annotation(BaseModel):
     on: str | None = None
 
 
+# Sentinel distinguishing "not yet computed" from a cached None result.
+_UNSET: Any = object()
+
+
 class Canvas(BaseModel):
     """
     IIIF canvas (represents a page/view).
@@ -127,20 +137,37 @@ class Canvas(BaseModel):
     height: int | None = None
     images: list[Annotation] = Field(default_factory=list)
 
+    # default_factory (not default) so pydantic doesn't deepcopy the
+    # sentinel, which would break the identity check below.
+    _primary_service_cache: Any = PrivateAttr(default_factory=lambda: _UNSET)
+
     def primary_image_service(self) -> ImageService | None:
         """
         Get primary image service for OCR.
 
         Returns the first available image service from the canvas's
-        primary image annotation.
+        primary image annotation. Both validation and image_url() call
+        this per canvas, so the resolved service is cached after the
+        first lookup.
 
         Returns:
             Primary ImageService if available, None otherwise
         """
-        if not self.images:
-            return None
-        first_anno = self.images[0]
-        return first_anno.resource.first_service()
+        if self._primary_service_cache is not _UNSET:
+            return self._primary_service_cache
+
+        service: ImageService | None = None
+        if self.images:
+            # Inlined first_service(): the union is already narrowed by
+            # validation, so a single list check suffices.
+            raw = self.images[0].resource.service
+            if type(raw) is list:
+                service = raw[0] if raw else None
+            else:
+                service = raw
+
+        self._primary_service_cache = service
+        return service
 
     def image_url(
         self,
@@ -210,12 +237,16 @@ class Manifest(BaseModel):
     metadata: list[dict[str, Any]] | None = None
     sequences: list[Sequence] = Field(default_factory=list)
 
+    _canvases_cache: list[Canvas] | None = PrivateAttr(default=None)
+
     def canvases(self) -> list[Canvas]:
         """
         Get all canvases in reading order.
 
         Traverses all sequences and returns all canvases in order.
         This is the primary method for iterating pages in a manifest.
+        The flattened list is computed once and cached, since pipeline
+        callers invoke this repeatedly (enumeration, validation).
 
         Returns:
             List of canvases in reading order
@@ -225,10 +256,9 @@ class Manifest(BaseModel):
             >>> for canvas in manifest.canvases():
             ...     print(canvas.id)
         """
-        result: list[Canvas] = []
-        for seq in self.sequences:
-            result.extend(seq.canvases)
-        return result
+        if self._canvases_cache is None:
+            self._canvases_cache = [c for s in self.sequences for c in s.canvases]
+        return self._canvases_cache
 
 
 class Collection(BaseModel):
@@ -263,3 +293,13 @@ class Collection(BaseModel):
             ...     print(manifest_id)
         """
         return [m.get("@id") for m in self.manifests if "@id" in m]
+
+
+# Force pydantic-core schema compilation at import time and expose the
+# compiled validators. Building the nested Manifest schema is the heavy
+# part of a cold start; doing it once here means short-lived CLI/SLURM
+# processes pay it exactly once, and hot callers (loaders.parse_manifest)
+# can invoke the SchemaValidator directly, skipping the BaseModel
+# classmethod dispatch on every call.
+_MANIFEST_VALIDATOR = Manifest.__pydantic_validator__
+_COLLECTION_VALIDATOR = Collection.__pydantic_validator__
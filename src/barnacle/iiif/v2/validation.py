@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from .models import Manifest, Collection, Canvas
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     """
     Represents a validation problem.
@@ -50,37 +50,36 @@ def validate_manifest(manifest: Manifest) -> list[ValidationIssue]:
         ...     for issue in issues:
         ...         print(f"{issue.path}: {issue.message}")
     """
-    issues: list[ValidationIssue] = []
-
     if not manifest.sequences:
-        issues.append(ValidationIssue("sequences", "Missing or empty sequences[]."))
-        return issues
-
-    canvas_count = 0
-    for seq_i, seq in enumerate(manifest.sequences):
-        for c_i, canvas in enumerate(seq.canvases):
-            canvas_count += 1
-
-            if not canvas.images:
-                issues.append(
-                    ValidationIssue(
-                        f"sequences[{seq_i}].canvases[{c_i}].images",
-                        "Canvas missing images[].",
-                    )
-                )
-                continue
-
-            service = canvas.primary_image_service()
-            if service is None:
-                issues.append(
-                    ValidationIssue(
-                        f"sequences[{seq_i}].canvases[{c_i}].images[0].resource.service",
-                        "Image resource missing service (IIIF Image API).",
-                    )
-                )
-
-    if canvas_count == 0:
-        issues.append(ValidationIssue("sequences[*].canvases", "No canvases found."))
+        return [ValidationIssue("sequences", "Missing or empty sequences[].")]
+
+    # Enumerate once, then collect issues with flat comprehensions: no
+    # per-iteration list.append lookup in the hot canvas loop.
+    canvases = [
+        (seq_i, c_i, canvas)
+        for seq_i, seq in enumerate(manifest.sequences)
+        for c_i, canvas in enumerate(seq.canvases)
+    ]
+
+    if not canvases:
+        return [ValidationIssue("sequences[*].canvases", "No canvases found.")]
+
+    issues = [
+        ValidationIssue(
+            f"sequences[{seq_i}].canvases[{c_i}].images",
+            "Canvas missing images[].",
+        )
+        for seq_i, c_i, canvas in canvases
+        if not canvas.images
+    ]
+    issues += [
+        ValidationIssue(
+            f"sequences[{seq_i}].canvases[{c_i}].images[0].resource.service",
+            "Image resource missing service (IIIF Image API).",
+        )
+        for seq_i, c_i, canvas in canvases
+        if canvas.images and canvas.primary_image_service() is None
+    ]
 
     return issues
 
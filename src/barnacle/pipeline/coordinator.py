@@ -7,15 +7,18 @@ suitable for SLURM job arrays or other parallel processing systems.
 
 from __future__ import annotations
 
+import mmap
+import struct
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
 
-from barnacle.iiif.v2 import iter_manifests
+from barnacle.iiif.v2 import iter_manifest_ids
 
 from .output import manifest_output_path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ManifestTask:
     """
     Represents a single manifest processing task.
@@ -63,13 +66,15 @@ def prepare_manifest_list(
         >>> for task in tasks:
         ...     print(f"{task.manifest_id} -> {task.output_path}")
     """
-    tasks: list[ManifestTask] = []
-
-    for manifest_id, _manifest in iter_manifests(collection_or_manifest):
-        output_path = manifest_output_path(manifest_id, output_dir)
-        tasks.append(ManifestTask(manifest_id=manifest_id, output_path=output_path))
-
-    return tasks
+    # Only manifest URLs are needed here, so use the id-only fast path:
+    # no per-manifest fetch, no pydantic validation.
+    return [
+        ManifestTask(
+            manifest_id=manifest_id,
+            output_path=manifest_output_path(manifest_id, output_dir),
+        )
+        for manifest_id in iter_manifest_ids(collection_or_manifest)
+    ]
 
 
 def write_manifest_list(tasks: list[ManifestTask], manifest_list_path: Path) -> None:
@@ -90,6 +95,66 @@ def write_manifest_list(tasks: list[ManifestTask], manifest_list_path: Path) ->
         >>> write_manifest_list(tasks, Path("manifests.txt"))
     """
     manifest_list_path.parent.mkdir(parents=True, exist_ok=True)
-    with manifest_list_path.open("w", encoding="utf-8") as f:
-        for task in tasks:
-            f.write(f"{task.manifest_id}\t{task.output_path}\n")
+    # Join all lines and write them in a single call: one allocation and
+    # one syscall path instead of one per task.
+    lines = [
+        f"{task.manifest_id}\t{task.output_path}\n".encode("utf-8") for task in tasks
+    ]
+    manifest_list_path.write_bytes(b"".join(lines))
+
+    # Companion offset index (native uint64 per task) so array jobs can
+    # seek straight to their line via read_manifest_task instead of
+    # scanning the whole file with sed -n "${N}p".
+    offsets = array("Q")
+    offset = 0
+    for line in lines:
+        offsets.append(offset)
+        offset += len(line)
+    _index_path(manifest_list_path).write_bytes(offsets.tobytes())
+
+
+def _index_path(manifest_list_path: Path) -> Path:
+    """Path of the byte-offset index written next to a manifest list."""
+    return manifest_list_path.with_suffix(".idx")
+
+
+def read_manifest_task(manifest_list_path: Path, index: int) -> ManifestTask:
+    """
+    Read one task from a manifest list by array index in O(1).
+
+    Uses the .idx offset file written by write_manifest_list to seek
+    directly to the task's line, so a 10k-task SLURM array does 10k
+    constant-time lookups instead of 10k full-file scans.
+
+    Parameters:
+        manifest_list_path: Path to the manifest list file
+        index: Zero-based task index
+
+    Returns:
+        ManifestTask for that index
+
+    Raises:
+        IndexError: If index is out of range
+        FileNotFoundError: If the list or its .idx companion is missing
+
+    Example:
+        >>> task = read_manifest_task(Path("manifests.txt"), task_index)
+        >>> result = process_manifest(task.manifest_id, task.output_path, ...)
+    """
+    idx_path = _index_path(manifest_list_path)
+    with idx_path.open("rb") as f:
+        f.seek(index * 8)
+        raw = f.read(8)
+    if len(raw) < 8:
+        raise IndexError(f"Task index {index} out of range for {manifest_list_path}")
+    (offset,) = struct.unpack("=Q", raw)
+
+    with manifest_list_path.open("rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.find(b"\n", offset)
+            if end == -1:
+                end = len(mm)
+            line = mm[offset:end].decode("utf-8")
+
+    manifest_id, _, output_path = line.partition("\t")
+    return ManifestTask(manifest_id=manifest_id, output_path=Path(output_path))
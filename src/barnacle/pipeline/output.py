@@ -7,18 +7,82 @@ and tracks which pages have already been processed for resume functionality.
 
 from __future__ import annotations
 
+from array import array
 from pathlib import Path
+import functools
 import hashlib
-import json
-from typing import Any
+import mmap
+import os
+import re
+import signal
+import time
+from typing import Any, Iterator
+
+import orjson
+
+
+# Fast-path extractor for the page_key field of a JSONL record; handles
+# escaped characters inside the string value.
+_PAGE_KEY_RE = re.compile(rb'"page_key"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+
+# Filename digest scheme. The hash only needs to be deterministic and
+# collision-resistant enough for filenames, not cryptographic; BLAKE2b-160
+# is faster than SHA-1 for these short inputs and keeps the 40-hex-char
+# stem. SHA-1 paths written by older runs are still honored on resume.
+HASH_SCHEME = "blake2b"
+
+
+@functools.lru_cache(maxsize=4096)
+def _fname_hash(s: str) -> str:
+    """40-hex-char filename digest (BLAKE2b-160), memoized per process.
+
+    manifest_output_path is called in tight loops over collections and
+    the same ids recur (task prep, worker resume, retries); caching the
+    digest skips the rehash.
+    """
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=20).hexdigest()
+
+
+@functools.lru_cache(maxsize=4096)
+def _legacy_sha1(s: str) -> str:
+    """Legacy SHA-1 filename digest for pre-BLAKE2b outputs.
+
+    usedforsecurity=False lets OpenSSL dispatch to the CPU's SHA
+    extensions where available and keeps the call valid under FIPS.
+    """
+    return hashlib.new("sha1", s.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolved_output_path(manifest_id: str, base: str) -> str:
+    """Resolve a manifest's output path string, memoized per process.
+
+    The same (manifest_id, output_dir) pair recurs across task prep,
+    resume checks, and retries; caching the resolved string skips the
+    exists() stats on repeat calls. The legacy-vs-current decision is
+    therefore made once per process, which is the behavior a resuming
+    run wants anyway.
+    """
+    # os.path.join on plain strings is cheaper than Path.__truediv__ when
+    # this runs once per manifest in a large collection; only the final
+    # result is wrapped in a Path.
+    path = os.path.join(base, _fname_hash(manifest_id) + ".jsonl")
+    if not os.path.exists(path):
+        legacy = os.path.join(base, _legacy_sha1(manifest_id) + ".jsonl")
+        if os.path.exists(legacy):
+            return legacy
+    return path
 
 
 def manifest_output_path(manifest_id: str, output_dir: Path) -> Path:
     """
-    Generate SHA1-based output path for manifest.
+    Generate hash-based output path for manifest.
 
-    Creates a deterministic filename from the manifest URL using SHA1 hash.
-    This ensures each manifest writes to its own file.
+    Creates a deterministic filename from the manifest URL using a
+    40-hex-char digest (see HASH_SCHEME). This ensures each manifest
+    writes to its own file. If an output already exists at the legacy
+    SHA-1 name from an earlier run, that path is returned so resume
+    keeps appending to the same file.
 
     Parameters:
         manifest_id: Manifest URL or identifier
@@ -34,8 +98,7 @@ def manifest_output_path(manifest_id: str, output_dir: Path) -> Path:
         >>> print(path)
         runs/ocr/abc123...def.jsonl
     """
-    sha1_hash = hashlib.sha1(manifest_id.encode("utf-8")).hexdigest()
-    return output_dir / f"{sha1_hash}.jsonl"
+    return Path(_resolved_output_path(manifest_id, os.fspath(output_dir)))
 
 
 def page_key(
@@ -55,6 +118,10 @@ def page_key(
     Creates a unique key for each page that incorporates all processing
     parameters. Used for resume-safe runs to identify already-processed pages.
 
+    Callers should compute the key once per page and reuse that value for
+    both the resume-set membership check and the record's page_key field,
+    rather than rebuilding it at each site.
+
     Parameters:
         manifest_id: Manifest URL
         canvas_id: Canvas identifier
@@ -80,11 +147,58 @@ def page_key(
         ...     rotation="0"
         ... )
     """
-    return "|".join(
-        [manifest_id, canvas_id, model, fmt, size, quality, region, rotation]
+    # Single f-string: no intermediate list or join dispatch for a fixed
+    # field count.
+    return (
+        f"{manifest_id}|{canvas_id}|{model}|{fmt}"
+        f"|{size}|{quality}|{region}|{rotation}"
     )
 
 
+def make_page_key(
+    *,
+    model: str,
+    fmt: str,
+    size: str,
+    quality: str,
+    region: str,
+    rotation: str,
+) -> Any:
+    """
+    Build a specialized page-key function for fixed run parameters.
+
+    Within a run everything except the manifest and canvas ids is
+    constant, so the six parameter fields are joined once here and the
+    returned closure only fills in the two varying ids per page —
+    instead of re-joining all eight fields per call. Output is identical
+    to page_key() with the same arguments.
+
+    Parameters:
+        model: OCR model identifier
+        fmt: IIIF image format
+        size: IIIF size parameter
+        quality: IIIF quality parameter
+        region: IIIF region parameter
+        rotation: IIIF rotation parameter
+
+    Returns:
+        Callable taking (manifest_id, canvas_id) and returning the key
+
+    Example:
+        >>> key_for = make_page_key(
+        ...     model="model.mlmodel", fmt="jpg", size="!3000,3000",
+        ...     quality="default", region="full", rotation="0",
+        ... )
+        >>> key_for(manifest_id, canvas.id)
+    """
+    const = f"|{model}|{fmt}|{size}|{quality}|{region}|{rotation}"
+
+    def key(manifest_id: str, canvas_id: str) -> str:
+        return f"{manifest_id}|{canvas_id}{const}"
+
+    return key
+
+
 def load_processed_keys(output_path: Path) -> set[str]:
     """
     Load page_key set from existing JSONL output file.
@@ -105,28 +219,395 @@ def load_processed_keys(output_path: Path) -> set[str]:
         >>> print(f"Already processed: {len(processed)} pages")
     """
     processed: set[str] = set()
+    _scan_page_keys(output_path, processed, _add_page_key)
+    return processed
+
+
+def key_hash(key: str) -> int:
+    """
+    64-bit fingerprint of a page key for in-memory membership tests.
+
+    Resume state only needs membership, not the key text: storing
+    fingerprints instead of full key strings (manifest URL + canvas URL +
+    parameters, often >100 bytes each) shrinks the resume set by roughly
+    an order of magnitude on million-page collections. The on-disk record
+    keeps the full string form.
+
+    Parameters:
+        key: Page key string from page_key()
+
+    Returns:
+        Unsigned 64-bit integer fingerprint
+    """
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+def _sidecar_path(output_path: Path) -> Path:
+    """Path of the fingerprint sidecar written next to a JSONL output."""
+    return output_path.with_suffix(".keys")
+
+
+def discard_stale_sidecar(output_path: Path) -> None:
+    """
+    Remove a .keys sidecar whose JSONL output is missing.
+
+    A sidecar without its JSONL (e.g. the output was deleted to force
+    reprocessing) would wrongly skip pages on resume. Call this once
+    from the coordinating process before any workers start: doing it
+    inside every writer would race under parallel workers sharing one
+    output file, where a late starter could unlink the sidecar an
+    earlier worker already holds open and silently lose its
+    fingerprints.
+
+    Parameters:
+        output_path: Path to JSONL output file
+    """
     if not output_path.exists():
+        _sidecar_path(output_path).unlink(missing_ok=True)
+
+
+def load_processed_key_hashes(output_path: Path) -> set[int]:
+    """
+    Load page_key fingerprints from existing JSONL output file.
+
+    When the .keys fingerprint sidecar written by JsonlWriter is
+    present, it is read instead of scanning the records: 8 bytes per
+    page rather than a full record, so resume I/O shrinks by the
+    record-to-fingerprint size ratio. Sidecar entries are appended only
+    after the corresponding records are durable, so the sidecar can lag
+    the JSONL (a few pages reprocess) but never lead it. Outputs without
+    a sidecar fall back to the same scan as load_processed_keys, storing
+    key_hash() fingerprints instead of the key strings. Pair with
+    key_hash() when testing membership.
+
+    Parameters:
+        output_path: Path to JSONL output file
+
+    Returns:
+        Set of 64-bit page key fingerprints
+
+    Example:
+        >>> processed = load_processed_key_hashes(output_path)
+        >>> key_hash(k) in processed
+        False
+    """
+    sidecar = _sidecar_path(output_path)
+    if output_path.exists() and sidecar.exists():
+        try:
+            raw = sidecar.read_bytes()
+        except OSError:
+            raw = b""
+        if raw:
+            hashes = array("Q")
+            hashes.frombytes(raw[: len(raw) - (len(raw) % 8)])
+            return set(hashes)
+
+    processed: set[int] = set()
+    _scan_page_keys(output_path, processed, _add_page_key_hash)
+    return processed
+
+
+def load_all_processed_key_hashes(
+    paths: list[Path],
+    *,
+    max_workers: int | None = None,
+) -> set[int]:
+    """
+    Load page_key fingerprints from many JSONL files in parallel.
+
+    Cold-start recovery over a sharded output directory is embarrassingly
+    parallel: each file's scan is independent, so they are farmed out to
+    a process pool and the resulting sets unioned in the parent. Small
+    inputs skip the pool entirely, since spawning workers costs more
+    than scanning a file or two.
+
+    Parameters:
+        paths: JSONL output files to scan
+        max_workers: Pool size; defaults to os.cpu_count() capped at the
+            number of files
+
+    Returns:
+        Union of 64-bit page key fingerprints across all files
+
+    Example:
+        >>> processed = load_all_processed_key_hashes(
+        ...     sorted(output_dir.glob("*.jsonl"))
+        ... )
+    """
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, len(paths))
+    if len(paths) <= 1 or max_workers <= 1:
+        processed: set[int] = set()
+        for path in paths:
+            processed |= load_processed_key_hashes(path)
+        return processed
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        processed = set()
+        for shard in pool.map(load_processed_key_hashes, paths):
+            processed |= shard
         return processed
 
+
+def _scan_page_keys(output_path: Path, processed: set, add: Any) -> None:
+    """
+    Scan a JSONL file through a read-only mmap, feeding each line to ``add``.
+
+    Mapping the file lets the kernel serve pages straight from the page
+    cache — no intermediate read buffers or chunk-boundary tail
+    stitching — and mm.find gives a memchr-speed newline search. Each
+    line goes to ``add``, which pulls page_key out with a compiled regex
+    instead of building a full dict with a JSON parser; orjson is only
+    used as a fallback. A possibly-partial last line is fed through like
+    any other, and an unreadable file clears the set so the run
+    reprocesses.
+    """
+    if not output_path.exists():
+        return
+
     try:
-        with output_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
-                    # Ignore truncated/invalid lines (e.g., partial last line)
-                    continue
-                k = rec.get("page_key")
-                if isinstance(k, str):
-                    processed.add(k)
-    except OSError:
-        # If the file cannot be read, fall back to reprocessing
-        return set()
+        with output_path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0
+                while start < size:
+                    end = mm.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    add(mm[start:end], processed)
+                    start = end + 1
+    except (OSError, ValueError):
+        # If the file cannot be read or mapped, fall back to reprocessing
+        processed.clear()
 
-    return processed
+
+def _add_page_key_hash(line: bytes, processed: set[int]) -> None:
+    """Extract a page_key fingerprint from one JSONL line into the set."""
+    line = line.strip()
+    if not line:
+        return
+
+    m = _PAGE_KEY_RE.search(line)
+    if m is not None and b"\\" not in m.group(1):
+        # Plain keys hash identically from raw bytes and decoded text.
+        processed.add(
+            int.from_bytes(
+                hashlib.blake2b(m.group(1), digest_size=8).digest(), "little"
+            )
+        )
+        return
+
+    try:
+        rec = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return
+    k = rec.get("page_key")
+    if isinstance(k, str):
+        processed.add(key_hash(k))
+
+
+def _add_page_key(line: bytes, processed: set[str]) -> None:
+    """Extract page_key from one JSONL line into the processed set."""
+    line = line.strip()
+    if not line:
+        return
+
+    m = _PAGE_KEY_RE.search(line)
+    if m is not None and b"\\" not in m.group(1):
+        processed.add(m.group(1).decode("utf-8"))
+        return
+
+    # Escaped or oddly-shaped line: let the real parser decide.
+    try:
+        rec = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        # Ignore truncated/invalid lines (e.g., partial last line)
+        return
+    k = rec.get("page_key")
+    if isinstance(k, str):
+        processed.add(k)
+
+
+def iter_records(output_path: Path) -> Iterator[dict[str, Any]]:
+    """
+    Stream records from a JSONL output file one dict at a time.
+
+    Reads the file in large binary chunks and yields each line's parsed
+    record, so consumers never hold the whole file (or a list of its
+    lines) in memory. Invalid or truncated lines — e.g. a partial last
+    line from an interrupted run — are skipped, matching the tolerance
+    of the resume scan.
+
+    Parameters:
+        output_path: Path to JSONL output file
+
+    Yields:
+        One dict per valid record, in file order
+
+    Example:
+        >>> for rec in iter_records(output_path):
+        ...     print(rec["page_key"])
+    """
+    if not output_path.exists():
+        return
+
+    with output_path.open("rb") as f:
+        tail = b""
+        while chunk := f.read(1 << 20):
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            for line in lines:
+                if line := line.strip():
+                    try:
+                        yield orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue
+        if tail := tail.strip():
+            try:
+                yield orjson.loads(tail)
+            except orjson.JSONDecodeError:
+                pass
+
+
+class JsonlWriter:
+    """
+    Context-managed append writer for JSONL output.
+
+    Opens the output file once and shares an append descriptor across
+    all records in a run, instead of paying mkdir/open/close per record
+    the way repeated append_record calls do. Records are staged in an
+    internal buffer and each checkpoint goes out as a single os.write
+    on an O_APPEND descriptor, so whole lines land contiguously:
+    concurrent worker processes sharing one output file never see
+    another writer's bytes spliced into the middle of a line, the same
+    guarantee append_record gives one-shot writes.
+
+    Durability is checkpoint-based rather than per-write: staged records
+    are written and fsync'd every ``checkpoint_every`` records or
+    ``sync_interval`` seconds, whichever comes first. On parallel
+    filesystems (Lustre/GPFS) per-record fsync caps throughput at commit
+    speed; a checkpoint bounds what an interruption can lose to the
+    resume scan at one checkpoint's worth of lines. While active, a
+    SIGTERM (e.g. SLURM preemption) triggers a final checkpoint before
+    the previous handler runs.
+
+    Alongside the records, fingerprints passed to note_key_hash are
+    appended to a .keys sidecar (8 raw bytes each) at each checkpoint,
+    after the records themselves are durable. Resume loads read the
+    sidecar instead of re-scanning the full JSONL.
+
+    Example:
+        >>> with JsonlWriter(output_path) as writer:
+        ...     for rec in records:
+        ...         writer.write(rec)
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        *,
+        checkpoint_every: int = 16,
+        sync_interval: float = 5.0,
+    ) -> None:
+        self.output_path = output_path
+        self.checkpoint_every = checkpoint_every
+        self.sync_interval = sync_interval
+        self._fd = -1
+        self._keys_fd = -1
+        self._buf = bytearray()
+        self._pending = 0
+        self._pending_hashes = array("Q")
+        self._last_sync = 0.0
+        self._prev_sigterm: Any = None
+
+    def __enter__(self) -> JsonlWriter:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Stale-sidecar cleanup happens in the coordinator (see
+        # discard_stale_sidecar); unlinking here would race with other
+        # writers sharing this output file.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        self._fd = os.open(self.output_path, flags, 0o644)
+        self._keys_fd = os.open(_sidecar_path(self.output_path), flags, 0o644)
+        self._last_sync = time.monotonic()
+        try:
+            self._prev_sigterm = signal.signal(signal.SIGTERM, self._on_sigterm)
+        except ValueError:
+            # Not in the main thread; skip the handler.
+            self._prev_sigterm = None
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._prev_sigterm is not None:
+            signal.signal(signal.SIGTERM, self._prev_sigterm)
+            self._prev_sigterm = None
+        self._checkpoint()
+        os.close(self._fd)
+        self._fd = -1
+        os.close(self._keys_fd)
+        self._keys_fd = -1
+
+    def _on_sigterm(self, signum: int, frame: Any) -> None:
+        self._checkpoint()
+        prev = self._prev_sigterm
+        if callable(prev):
+            prev(signum, frame)
+        else:
+            raise SystemExit(128 + signum)
+
+    def _checkpoint(self) -> None:
+        if self._buf:
+            # One O_APPEND write for the whole checkpoint keeps it
+            # contiguous; loop only on the rare short write so no byte
+            # is dropped.
+            data = bytes(self._buf)
+            written = os.write(self._fd, data)
+            while written < len(data):
+                written += os.write(self._fd, data[written:])
+            os.fsync(self._fd)
+            self._buf.clear()
+        # Fingerprints go out only after their records are durable, so
+        # the sidecar never claims a page the JSONL doesn't have.
+        if self._pending_hashes:
+            os.write(self._keys_fd, self._pending_hashes.tobytes())
+            os.fsync(self._keys_fd)
+            del self._pending_hashes[:]
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def _maybe_checkpoint(self) -> None:
+        if (
+            self._pending >= self.checkpoint_every
+            or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self._checkpoint()
+
+    def note_key_hash(self, kh: int) -> None:
+        """Stage a page's key_hash() fingerprint for the .keys sidecar."""
+        self._pending_hashes.append(kh)
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Stage a single record as one JSONL line."""
+        # orjson serializes straight to UTF-8 bytes, so the line lands
+        # in the staging buffer without a separate encode pass.
+        self._buf += orjson.dumps(record)
+        self._buf += b"\n"
+        self._pending += 1
+        self._maybe_checkpoint()
+
+    def write_many(self, records: list[dict[str, Any]]) -> None:
+        """Stage a burst of records for the next checkpoint write."""
+        buf = self._buf
+        for record in records:
+            buf += orjson.dumps(record)
+            buf += b"\n"
+        self._pending += len(records)
+        self._maybe_checkpoint()
 
 
 def append_record(output_path: Path, record: dict[str, Any]) -> None:
@@ -134,7 +615,16 @@ def append_record(output_path: Path, record: dict[str, Any]) -> None:
     Append a record to JSONL output file.
 
     Writes a single JSON record as one line to the output file.
-    Creates parent directories if they don't exist.
+    Creates parent directories if they don't exist. The line goes out
+    as one os.write on an O_APPEND descriptor, so concurrent workers
+    sharing a file never interleave partial lines and no buffered
+    writer is constructed for a single record. If the output has a
+    .keys sidecar, the record's page_key fingerprint is appended to it
+    as well (after fsyncing the record, so the sidecar never leads the
+    JSONL), keeping sidecar-based resume loads complete for outputs
+    that mix JsonlWriter runs with one-off appends. One-off
+    convenience; loops should hold a JsonlWriter open instead of
+    calling this per record.
 
     Parameters:
         output_path: Path to JSONL output file
@@ -146,5 +636,18 @@ def append_record(output_path: Path, record: dict[str, Any]) -> None:
         >>> append_record(output_path, record)
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+    fd = os.open(output_path, flags, 0o644)
+    try:
+        os.write(fd, orjson.dumps(record) + b"\n")
+        k = record.get("page_key")
+        sidecar = _sidecar_path(output_path)
+        if isinstance(k, str) and sidecar.exists():
+            os.fsync(fd)
+            kfd = os.open(sidecar, flags, 0o644)
+            try:
+                os.write(kfd, array("Q", [key_hash(k)]).tobytes())
+            finally:
+                os.close(kfd)
+    finally:
+        os.close(fd)
@@ -7,18 +7,30 @@ from SLURM job array tasks or other parallel execution environments.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 import time
 from datetime import datetime, timezone
 
 import httpx
 
-from barnacle.iiif.v2 import load_manifest, validate_manifest, ValidationIssue
+from barnacle.iiif.v2 import Manifest, load_manifest, validate_manifest, ValidationIssue
 from barnacle.ocr import KrakenBackend
 
-from .output import page_key, load_processed_keys, append_record
+from .output import (
+    key_hash,
+    load_processed_key_hashes,
+    make_page_key,
+    JsonlWriter,
+    _fname_hash,
+)
 
 
 DEFAULT_IIIF_SIZE = "!3000,3000"
@@ -26,6 +38,28 @@ DEFAULT_IIIF_FORMAT = "jpg"
 DEFAULT_IIIF_QUALITY = "default"
 DEFAULT_IIIF_REGION = "full"
 DEFAULT_IIIF_ROTATION = "0"
+DEFAULT_FETCH_CONCURRENCY = 8
+# Downloaded-but-not-yet-OCR'd images the fetcher may buffer, as a multiple
+# of fetch_concurrency. Window permits are returned by the consumer as it
+# takes results, so download memory stays bounded even though OCR is orders
+# of magnitude slower than the downloads running ahead of it.
+PREFETCH_WINDOW_FACTOR = 2
+# Pages per backend.ocr_images call; amortizes model and inference-context
+# setup without letting a batch failure cost too many pages.
+OCR_BATCH_SIZE = 4
+
+
+# Resume fingerprints shared across a batch, installed once per worker
+# process by _init_worker. A pool-wide resume set pickled into every
+# submitted task would be re-serialized O(manifests) times; the
+# initializer ships it exactly once per worker.
+_SHARED_PROCESSED_KEYS: set[int] | None = None
+
+
+def _init_worker(processed_keys: set[int] | None) -> None:
+    """ProcessPoolExecutor initializer: stash the batch-wide resume set."""
+    global _SHARED_PROCESSED_KEYS
+    _SHARED_PROCESSED_KEYS = processed_keys
 
 
 @dataclass
@@ -52,13 +86,148 @@ class ProcessingResult:
     success: bool
 
 
-def fetch_bytes(url: str, *, timeout: float = 30.0) -> bytes:
+@dataclass
+class _PageTask:
+    """
+    One canvas's worth of pending OCR work.
+
+    Built during the pre-scan over canvases so that image downloads can be
+    issued ahead of the OCR cursor.
+    """
+
+    canvas_index: int
+    canvas_id: str
+    image_url: str
+    page_key: str
+    key_hash: int
+    img_path: Path | None
+    needs_download: bool
+    # Downloaded image held in memory when no cache directory is used.
+    img_bytes: bytes | None = None
+
+
+async def _fetch_all(
+    items: list[tuple[int, str]],
+    results: queue.Queue,
+    concurrency: int,
+    window: asyncio.Semaphore,
+) -> None:
+    """
+    Fetch image URLs concurrently, pushing (index, content, error) tuples.
+
+    Concurrency is capped by a semaphore so a large manifest does not open
+    hundreds of simultaneous connections to the IIIF server. The window
+    semaphore bounds how far the downloads run ahead of the consumer: a
+    permit is acquired before each fetch starts and released by the
+    consumer only when it takes that fetch's result, so at most
+    window-many page images are ever held in memory. Tasks acquire the
+    window in submission (canvas) order, which guarantees the index the
+    consumer is waiting on always starts before any later one.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        timeout=30.0,
+        limits=httpx.Limits(
+            max_keepalive_connections=concurrency,
+            max_connections=concurrency,
+        ),
+    ) as client:
+
+        async def _fetch_one(index: int, url: str) -> None:
+            # Held until the consumer dequeues this result; releases come
+            # back via loop.call_soon_threadsafe (see _start_fetcher).
+            await window.acquire()
+            async with sem:
+                # Catch everything, not just httpx.HTTPError: an
+                # unexpected error (missing h2 on an HTTP/2 server,
+                # MemoryError on a huge image) escaping here would kill
+                # the fetcher thread and strand the consumer.
+                try:
+                    resp = await client.get(url)
+                    resp.raise_for_status()
+                    results.put((index, resp.content, None))
+                except Exception as e:
+                    results.put((index, None, e))
+
+        await asyncio.gather(*(_fetch_one(i, u) for i, u in items))
+
+
+def _start_fetcher(
+    downloads: list[tuple[int, str]],
+    results: queue.Queue,
+    concurrency: int,
+) -> tuple[threading.Thread, Callable[[], None]]:
+    """
+    Start the background prefetch thread with a bounded buffer window.
+
+    Returns the thread plus a release callback the consumer must invoke
+    once per result it consumes. The callback returns one window permit
+    to the fetcher's event loop, letting the next download start; until
+    then at most PREFETCH_WINDOW_FACTOR * concurrency images sit between
+    the fetcher and the OCR cursor.
+    """
+    loop = asyncio.new_event_loop()
+    window = asyncio.Semaphore(PREFETCH_WINDOW_FACTOR * concurrency)
+
+    def _run_fetches() -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(
+                _fetch_all(downloads, results, concurrency, window)
+            )
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    def _release() -> None:
+        # After the last fetch lands the loop closes; a release arriving
+        # then has nothing left to wake and is safe to drop.
+        try:
+            loop.call_soon_threadsafe(window.release)
+        except RuntimeError:
+            pass
+
+    thread = threading.Thread(target=_run_fetches, daemon=True)
+    thread.start()
+    return thread, _release
+
+
+def _write_cache_file(path: Path, data: bytes) -> None:
+    """
+    Write a cache file with an exclusive create.
+
+    One syscall replaces the exists-then-write pair, and losing the race
+    to another worker sharing the cache directory is a quiet no-op
+    instead of a duplicate write.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def fetch_bytes(
+    url: str,
+    *,
+    timeout: float = 30.0,
+    client: httpx.Client | None = None,
+) -> bytes:
     """
     Fetch image bytes from URL.
 
     Parameters:
         url: Image URL
         timeout: Request timeout in seconds
+        client: Optional shared client. Callers fetching many images from
+            the same host should pass one so requests reuse keepalive
+            connections instead of paying a TLS handshake per image
 
     Returns:
         Image data as bytes
@@ -66,8 +235,13 @@ def fetch_bytes(url: str, *, timeout: float = 30.0) -> bytes:
     Raises:
         httpx.HTTPError: If request fails
     """
-    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-        resp = client.get(url)
+    if client is not None:
+        resp = client.get(url, timeout=timeout)
+        resp.raise_for_status()
+        return resp.content
+
+    with httpx.Client(timeout=timeout, follow_redirects=True) as one_shot:
+        resp = one_shot.get(url)
         resp.raise_for_status()
         return resp.content
 
@@ -77,7 +251,7 @@ def process_manifest(
     output_path: Path,
     *,
     model: str,
-    cache_dir: Path,
+    cache_dir: Path | None,
     max_pages: int | None = None,
     resume: bool = True,
     model_auto_install: bool = True,
@@ -88,6 +262,10 @@ def process_manifest(
     rotation: str = DEFAULT_IIIF_ROTATION,
     source_metadata_id: str | None = None,
     ark: str | None = None,
+    fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    processed_keys: set[int] | None = None,
+    workers: int = 1,
+    checkpoint_every: int = 16,
 ) -> ProcessingResult:
     """
     Process single manifest: fetch, validate, OCR pages, write JSONL.
@@ -105,9 +283,13 @@ def process_manifest(
         manifest_id: Manifest URL or path
         output_path: Path to output JSONL file
         model: Kraken model reference (DOI, name, or path)
-        cache_dir: Directory for image cache
+        cache_dir: Directory for image cache, or None to keep downloads
+            in memory and skip the disk write/read round-trip per page
         max_pages: Optional limit on number of pages to process
-        resume: Skip pages already in output file
+        resume: Skip pages already in output file. Callers that delete
+            an output JSONL to force reprocessing must also clear its
+            .keys sidecar (output.discard_stale_sidecar); the writer
+            does not, to avoid racing parallel workers on a shared file
         model_auto_install: Auto-install model from DOI if needed
         size: IIIF size parameter
         fmt: IIIF image format
@@ -116,6 +298,23 @@ def process_manifest(
         rotation: IIIF rotation parameter
         source_metadata_id: Optional provenance field
         ark: Optional provenance field
+        fetch_concurrency: Number of image downloads kept in flight ahead
+            of the OCR cursor. Downloaded-but-not-yet-OCR'd images are
+            bounded to a small multiple of this (PREFETCH_WINDOW_FACTOR),
+            so worker memory stays flat on book-scale manifests
+        processed_keys: Already-built resume set of page-key fingerprints
+            (see output.load_processed_key_hashes). Callers processing
+            many manifests into one output file should load this once and
+            share it, instead of paying a full JSONL scan per manifest.
+            When None, falls back to the set installed by _init_worker
+            (the batch driver ships it once per worker process), then to
+            a scan of output_path
+        workers: Number of threads running OCR within a batch. Useful on
+            multi-core allocations when the backend releases the GIL
+            (torch inference does); JSONL writes stay on one thread
+        checkpoint_every: Records between flush+fsync checkpoints of the
+            output file (see output.JsonlWriter); an interruption loses
+            at most this many records to the resume scan
 
     Returns:
         ProcessingResult with statistics
@@ -130,138 +329,329 @@ def process_manifest(
         >>> print(f"Processed {result.pages_processed} pages")
     """
     start_time = time.perf_counter()
-    pages_processed = 0
-    pages_skipped = 0
-    pages_failed = 0
 
     # Initialize OCR backend
     backend = KrakenBackend(model_auto_install=model_auto_install)
     resolved_model = backend.resolve_model(model)
 
-    # Setup cache directory
-    img_cache = cache_dir / "images"
-    img_cache.mkdir(parents=True, exist_ok=True)
-
-    # Load resume state
-    processed_keys = load_processed_keys(output_path) if resume else set()
-
+    # Setup cache directory (None = ephemeral, OCR straight from memory)
+    img_cache: Path | None = None
+    if cache_dir is not None:
+        img_cache = cache_dir / "images"
+        img_cache.mkdir(parents=True, exist_ok=True)
+
+    # Load resume state (unless the caller supplied a pre-built set,
+    # directly or via the pool initializer). Fingerprints, not key
+    # strings: membership is all that's needed.
+    if processed_keys is None:
+        processed_keys = _SHARED_PROCESSED_KEYS
+    if processed_keys is None:
+        processed_keys = load_processed_key_hashes(output_path) if resume else set()
+
+    # Load and validate manifest. Fetch/parse failures are expected here
+    # (network, malformed JSON); everything after is wrapped once at the
+    # _run call below so a worker never raises into the batch driver.
     try:
-        # Load and validate manifest
         manifest = load_manifest(manifest_id)
         validation_issues = validate_manifest(manifest)
+    except Exception:
+        return ProcessingResult(
+            manifest_id=manifest_id,
+            pages_processed=0,
+            pages_skipped=0,
+            pages_failed=0,
+            validation_issues=[],
+            elapsed_seconds=time.perf_counter() - start_time,
+            success=False,
+        )
 
-        if validation_issues:
-            # Manifest has validation issues, return early
-            elapsed = time.perf_counter() - start_time
-            return ProcessingResult(
-                manifest_id=manifest_id,
-                pages_processed=0,
-                pages_skipped=0,
-                pages_failed=0,
-                validation_issues=validation_issues,
-                elapsed_seconds=elapsed,
-                success=False,
-            )
+    if validation_issues:
+        # Manifest has validation issues, return early
+        return ProcessingResult(
+            manifest_id=manifest_id,
+            pages_processed=0,
+            pages_skipped=0,
+            pages_failed=0,
+            validation_issues=validation_issues,
+            elapsed_seconds=time.perf_counter() - start_time,
+            success=False,
+        )
 
-        # Process each canvas/page
-        for c_i, canvas in enumerate(manifest.canvases()):
-            if max_pages is not None and pages_processed >= max_pages:
-                break
-
-            # Generate IIIF Image API URL
-            image_url = canvas.image_url(
-                region=region,
-                size=size,
-                rotation=rotation,
-                quality=quality,
-                fmt=fmt,
-            )
+    try:
+        return _run(
+            manifest,
+            manifest_id=manifest_id,
+            output_path=output_path,
+            backend=backend,
+            model=model,
+            resolved_model=resolved_model,
+            img_cache=img_cache,
+            max_pages=max_pages,
+            resume=resume,
+            size=size,
+            fmt=fmt,
+            quality=quality,
+            region=region,
+            rotation=rotation,
+            source_metadata_id=source_metadata_id,
+            ark=ark,
+            fetch_concurrency=fetch_concurrency,
+            processed_keys=processed_keys,
+            workers=workers,
+            checkpoint_every=checkpoint_every,
+            start_time=start_time,
+        )
+    except Exception:
+        return ProcessingResult(
+            manifest_id=manifest_id,
+            pages_processed=0,
+            pages_skipped=0,
+            pages_failed=0,
+            validation_issues=[],
+            elapsed_seconds=time.perf_counter() - start_time,
+            success=False,
+        )
 
-            if image_url is None:
-                pages_failed += 1
-                continue
 
-            canvas_id = canvas.id
+def _run(
+    manifest: Manifest,
+    *,
+    manifest_id: str,
+    output_path: Path,
+    backend: KrakenBackend,
+    model: str,
+    resolved_model: str,
+    img_cache: Path | None,
+    max_pages: int | None,
+    resume: bool,
+    size: str,
+    fmt: str,
+    quality: str,
+    region: str,
+    rotation: str,
+    source_metadata_id: str | None,
+    ark: str | None,
+    fetch_concurrency: int,
+    processed_keys: set[int],
+    workers: int,
+    checkpoint_every: int,
+    start_time: float,
+) -> ProcessingResult:
+    """
+    Download, OCR, and write all pages of an already-validated manifest.
 
-            # Check if already processed (resume)
-            k = page_key(
-                manifest_id=manifest_id,
-                canvas_id=canvas_id,
-                model=resolved_model,
-                fmt=fmt,
-                size=size,
-                quality=quality,
-                region=region,
-                rotation=rotation,
-            )
+    Split out of process_manifest so the canvas loop runs outside the
+    prologue's try block; failures inside it are caught once at the call
+    site rather than interleaved with per-page handling.
+    """
+    pages_processed = 0
+    pages_skipped = 0
+    pages_failed = 0
 
-            if resume and k in processed_keys:
-                pages_skipped += 1
-                continue
+    # Pre-scan canvases into a work list so downloads can be issued
+    # ahead of the OCR cursor. Everything in the page key except
+    # canvas_id is constant across the loop, so specialize the key
+    # function once and check resume membership before doing any URL
+    # construction — on a mostly-done resume the skip path is a single
+    # string fill plus a set lookup.
+    page_key_for = make_page_key(
+        model=resolved_model,
+        fmt=fmt,
+        size=size,
+        quality=quality,
+        region=region,
+        rotation=rotation,
+    )
+
+    work: list[_PageTask] = []
+    for c_i, canvas in enumerate(manifest.canvases()):
+        if max_pages is not None and len(work) >= max_pages:
+            break
+
+        canvas_id = canvas.id
+
+        # Check if already processed (resume)
+        k = page_key_for(manifest_id, canvas_id)
+        kh = key_hash(k)
+        if resume and kh in processed_keys:
+            pages_skipped += 1
+            continue
+
+        # Generate IIIF Image API URL
+        image_url = canvas.image_url(
+            region=region,
+            size=size,
+            rotation=rotation,
+            quality=quality,
+            fmt=fmt,
+        )
 
-            # Download image (with caching)
-            import hashlib
+        if image_url is None:
+            pages_failed += 1
+            continue
+
+        if img_cache is not None:
+            img_path = img_cache / f"{_fname_hash(image_url)}.{fmt}"
+            needs_download = not img_path.exists()
+        else:
+            img_path = None
+            needs_download = True
+        work.append(
+            _PageTask(
+                canvas_index=c_i,
+                canvas_id=canvas_id,
+                image_url=image_url,
+                page_key=k,
+                key_hash=kh,
+                img_path=img_path,
+                needs_download=needs_download,
+            )
+        )
 
-            cache_key = hashlib.sha1(image_url.encode("utf-8")).hexdigest()
-            img_path = img_cache / f"{cache_key}.{fmt}"
+    # Prefetch uncached images on a background thread: network I/O for
+    # upcoming pages overlaps with OCR on the current page, while the
+    # window inside _start_fetcher keeps the fetcher from racing the
+    # whole manifest into memory when OCR falls behind.
+    downloads = [
+        (i, task.image_url) for i, task in enumerate(work) if task.needs_download
+    ]
+    results: queue.Queue = queue.Queue()
+    fetcher: threading.Thread | None = None
+    release_window: Callable[[], None] | None = None
+    if downloads:
+        fetcher, release_window = _start_fetcher(
+            downloads, results, fetch_concurrency
+        )
 
-            if not img_path.exists():
-                try:
-                    img_bytes = fetch_bytes(image_url)
-                    img_path.write_bytes(img_bytes)
-                except httpx.HTTPError:
-                    pages_failed += 1
-                    continue
+    fetched: dict[int, tuple[bytes | None, Exception | None]] = {}
+
+    # Hoist per-record constants and global lookups out of the hot loop.
+    # The constant fields (engine, model, provenance) live in one shared
+    # template merged into each record, so per page only the varying keys
+    # are allocated and the nested model dict is built once, not per
+    # record.
+    const_fields = {
+        "engine": backend.name,
+        "model": {"ref": model, "resolved": resolved_model},
+        "manifest_url": manifest_id,
+        "source_metadata_id": source_metadata_id,
+        "ark": ark,
+    }
+    utc = timezone.utc
+    now = datetime.now
+
+    # Optional OCR thread pool. Batches grow to the worker count so a
+    # flush can keep every thread busy; records are still written in
+    # canvas order from this thread only.
+    pool_cm: Any = (
+        ThreadPoolExecutor(max_workers=workers)
+        if workers > 1
+        else contextlib.nullcontext()
+    )
+    batch_size = max(OCR_BATCH_SIZE, workers)
+
+    with (
+        pool_cm as pool,
+        JsonlWriter(output_path, checkpoint_every=checkpoint_every) as writer,
+    ):
+        pending: list[_PageTask] = []
+
+        def _ocr_one(task: _PageTask) -> str:
+            if task.img_path is not None:
+                return backend.ocr_image(task.img_path, model=resolved_model)
+            return backend.ocr_bytes(task.img_bytes, model=resolved_model)
+
+        def _flush_batch() -> None:
+            """OCR the staged batch and write one record per page."""
+            nonlocal pages_processed, pages_failed
+            if not pending:
+                return
 
-            # Run OCR
             t0 = time.perf_counter()
             try:
-                text_out = backend.ocr_image(img_path, model=resolved_model)
-                elapsed_ms = int((time.perf_counter() - t0) * 1000)
+                if pool is not None:
+                    texts = list(pool.map(_ocr_one, pending))
+                elif img_cache is not None:
+                    texts = backend.ocr_images(
+                        [t.img_path for t in pending], model=resolved_model
+                    )
+                else:
+                    texts = [
+                        backend.ocr_bytes(t.img_bytes, model=resolved_model)
+                        for t in pending
+                    ]
             except Exception:
-                pages_failed += 1
-                continue
-
-            # Write result
-            rec: dict[str, Any] = {
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "page_key": k,
-                "canvas_index": c_i,
-                "engine": backend.name,
-                "model": {"ref": model, "resolved": resolved_model},
-                "manifest_url": manifest_id,
-                "canvas_id": canvas_id,
-                "image_url": image_url,
-                "elapsed_ms": elapsed_ms,
-                "text": text_out,
-                "source_metadata_id": source_metadata_id,
-                "ark": ark,
-            }
-
-            append_record(output_path, rec)
+                pages_failed += len(pending)
+                pending.clear()
+                return
+            # Per-page share of the batch's wall time.
+            elapsed_ms = int((time.perf_counter() - t0) * 1000 / len(pending))
+
+            recs: list[dict[str, Any]] = [
+                const_fields
+                | {
+                    "created_at": now(utc).isoformat(),
+                    "page_key": task.page_key,
+                    "canvas_index": task.canvas_index,
+                    "canvas_id": task.canvas_id,
+                    "image_url": task.image_url,
+                    "elapsed_ms": elapsed_ms,
+                    "text": text_out,
+                }
+                for task, text_out in zip(pending, texts)
+            ]
+            writer.write_many(recs)
+            for task in pending:
+                writer.note_key_hash(task.key_hash)
             if resume:
-                processed_keys.add(k)
-            pages_processed += 1
-
-        elapsed = time.perf_counter() - start_time
-        return ProcessingResult(
-            manifest_id=manifest_id,
-            pages_processed=pages_processed,
-            pages_skipped=pages_skipped,
-            pages_failed=pages_failed,
-            validation_issues=[],
-            elapsed_seconds=elapsed,
-            success=True,
-        )
+                processed_keys.update(task.key_hash for task in pending)
+            pages_processed += len(pending)
+            pending.clear()
+
+        for i, task in enumerate(work):
+            if task.needs_download:
+                # Drain completions until this page's download has landed.
+                # The timeout plus liveness check guards against the
+                # fetcher thread dying outside the per-fetch handler
+                # (e.g. client setup failure): fail the manifest rather
+                # than block on the queue forever.
+                while i not in fetched:
+                    try:
+                        index, content, error = results.get(timeout=30.0)
+                    except queue.Empty:
+                        if fetcher is None or not fetcher.is_alive():
+                            raise RuntimeError(
+                                "image fetch thread exited before "
+                                "delivering all results"
+                            )
+                        continue
+                    fetched[index] = (content, error)
+                content, error = fetched.pop(i)
+                # Consuming a result frees its window permit so the
+                # fetcher can start the next download.
+                release_window()
+                if error is not None:
+                    pages_failed += 1
+                    continue
+                if task.img_path is not None:
+                    _write_cache_file(task.img_path, content)
+                else:
+                    task.img_bytes = content
+
+            pending.append(task)
+            if len(pending) >= batch_size:
+                _flush_batch()
+
+        _flush_batch()
+
+    elapsed = time.perf_counter() - start_time
+    return ProcessingResult(
+        manifest_id=manifest_id,
+        pages_processed=pages_processed,
+        pages_skipped=pages_skipped,
+        pages_failed=pages_failed,
+        validation_issues=[],
+        elapsed_seconds=elapsed,
+        success=True,
+    )
 
-    except Exception as e:
-        elapsed = time.perf_counter() - start_time
-        return ProcessingResult(
-            manifest_id=manifest_id,
-            pages_processed=pages_processed,
-            pages_skipped=pages_skipped,
-            pages_failed=pages_failed,
-            validation_issues=[],
-            elapsed_seconds=elapsed,
-            success=False,
-        )
@@ -0,0 +1,65 @@
+"""Tests for pipeline coordinator manifest lists."""
+
+from pathlib import Path
+
+import pytest
+
+from barnacle.pipeline.coordinator import (
+    ManifestTask,
+    write_manifest_list,
+    read_manifest_task,
+)
+
+
+def _tasks(output_dir: Path) -> list[ManifestTask]:
+    return [
+        ManifestTask(
+            manifest_id=f"https://example.org/manifest/{i}",
+            output_path=output_dir / f"{i}.jsonl",
+        )
+        for i in range(5)
+    ]
+
+
+class TestManifestList:
+    """Tests for write_manifest_list() and read_manifest_task()."""
+
+    def test_writes_tsv_lines(self, tmp_path):
+        """Test the one-line-per-task tab-separated format."""
+        tasks = _tasks(tmp_path / "out")
+        list_path = tmp_path / "manifests.txt"
+
+        write_manifest_list(tasks, list_path)
+
+        lines = list_path.read_text().splitlines()
+        assert len(lines) == len(tasks)
+        assert lines[0] == f"{tasks[0].manifest_id}\t{tasks[0].output_path}"
+
+    def test_writes_offset_index(self, tmp_path):
+        """Test that the .idx companion holds one uint64 per task."""
+        tasks = _tasks(tmp_path / "out")
+        list_path = tmp_path / "manifests.txt"
+
+        write_manifest_list(tasks, list_path)
+
+        idx_path = list_path.with_suffix(".idx")
+        assert idx_path.exists()
+        assert idx_path.stat().st_size == len(tasks) * 8
+
+    def test_read_round_trips_every_index(self, tmp_path):
+        """Test that each index reads back its original task."""
+        tasks = _tasks(tmp_path / "out")
+        list_path = tmp_path / "manifests.txt"
+        write_manifest_list(tasks, list_path)
+
+        for i, task in enumerate(tasks):
+            assert read_manifest_task(list_path, i) == task
+
+    def test_read_out_of_range_raises_index_error(self, tmp_path):
+        """Test that an out-of-range task index raises IndexError."""
+        tasks = _tasks(tmp_path / "out")
+        list_path = tmp_path / "manifests.txt"
+        write_manifest_list(tasks, list_path)
+
+        with pytest.raises(IndexError):
+            read_manifest_task(list_path, len(tasks))
@@ -1,22 +1,28 @@
 """Tests for pipeline output utilities."""
 
 from pathlib import Path
-import tempfile
+import hashlib
 import json
 
 from barnacle.pipeline.output import (
     manifest_output_path,
     page_key,
+    make_page_key,
+    key_hash,
     load_processed_keys,
+    load_processed_key_hashes,
     append_record,
+    discard_stale_sidecar,
+    iter_records,
+    JsonlWriter,
 )
 
 
 class TestManifestOutputPath:
     """Tests for manifest_output_path() function."""
 
-    def test_generates_sha1_based_path(self):
-        """Test that output path uses SHA1 hash of manifest ID."""
+    def test_generates_blake2b_based_path(self):
+        """Test that output path uses the BLAKE2b-160 digest of the manifest ID."""
         manifest_id = "https://example.org/manifest/123"
         output_dir = Path("/tmp/ocr")
 
@@ -24,8 +30,20 @@ class TestManifestOutputPath:
 
         assert path.parent == output_dir
         assert path.suffix == ".jsonl"
-        # SHA1 hash is 40 hex characters
-        assert len(path.stem) == 40
+        # BLAKE2b-160 keeps the 40-hex-char stem of the old SHA-1 scheme
+        assert path.stem == hashlib.blake2b(
+            manifest_id.encode("utf-8"), digest_size=20
+        ).hexdigest()
+
+    def test_prefers_existing_legacy_sha1_output(self, tmp_path):
+        """Test that resume keeps appending to a pre-BLAKE2b SHA-1 file."""
+        manifest_id = "https://example.org/manifest/legacy"
+        legacy = tmp_path / (
+            hashlib.sha1(manifest_id.encode("utf-8")).hexdigest() + ".jsonl"
+        )
+        legacy.touch()
+
+        assert manifest_output_path(manifest_id, tmp_path) == legacy
 
     def test_same_manifest_id_produces_same_path(self):
         """Test deterministic output paths."""
@@ -110,145 +128,298 @@ class TestPageKey:
         assert key2 != key3
 
 
+class TestMakePageKey:
+    """Tests for make_page_key() factory."""
+
+    def test_factory_matches_page_key(self):
+        """Test that the specialized closure matches page_key output."""
+        params = {
+            "model": "model.mlmodel",
+            "fmt": "jpg",
+            "size": "!3000,3000",
+            "quality": "default",
+            "region": "full",
+            "rotation": "0",
+        }
+        key_for = make_page_key(**params)
+
+        assert key_for(
+            "https://example.org/manifest", "https://example.org/canvas/1"
+        ) == page_key(
+            manifest_id="https://example.org/manifest",
+            canvas_id="https://example.org/canvas/1",
+            **params,
+        )
+
+
+class TestKeyHash:
+    """Tests for key_hash() fingerprints."""
+
+    def test_key_hash_deterministic(self):
+        """Test that fingerprints are stable for the same key."""
+        assert key_hash("key1") == key_hash("key1")
+        assert key_hash("key1") != key_hash("key2")
+
+    def test_key_hash_is_unsigned_64_bit(self):
+        """Test that fingerprints fit the sidecar's uint64 slots."""
+        assert 0 <= key_hash("key1") < 2**64
+
+
+class TestLoadProcessedKeyHashes:
+    """Tests for load_processed_key_hashes() resume loading."""
+
+    def test_hashes_match_loaded_keys(self, tmp_path):
+        """Test that the fingerprint set mirrors the key-string set."""
+        output_path = tmp_path / "output.jsonl"
+        for k in ("key1", "key2", "key3"):
+            append_record(output_path, {"page_key": k, "text": "..."})
+
+        hashes = load_processed_key_hashes(output_path)
+
+        assert hashes == {key_hash(k) for k in load_processed_keys(output_path)}
+        assert key_hash("key1") in hashes
+        assert key_hash("other") not in hashes
+
+    def test_sidecar_preferred_over_scan(self, tmp_path):
+        """Test that the .keys sidecar is read instead of the records."""
+        output_path = tmp_path / "output.jsonl"
+        with JsonlWriter(output_path) as writer:
+            for k in ("key1", "key2"):
+                writer.write({"page_key": k})
+                writer.note_key_hash(key_hash(k))
+
+        sidecar = output_path.with_suffix(".keys")
+        assert sidecar.exists()
+        # Two 8-byte fingerprints, appended only at checkpoints.
+        assert sidecar.stat().st_size == 16
+        assert load_processed_key_hashes(output_path) == {
+            key_hash("key1"),
+            key_hash("key2"),
+        }
+
+    def test_sidecar_never_leads_unnoted_records_reprocess(self, tmp_path):
+        """Test that records missing from the sidecar are not skipped as done."""
+        output_path = tmp_path / "output.jsonl"
+        with JsonlWriter(output_path) as writer:
+            writer.write({"page_key": "key1"})
+            writer.note_key_hash(key_hash("key1"))
+            # Written but never noted: the sidecar lags, which must only
+            # ever cause reprocessing, not skipping.
+            writer.write({"page_key": "key2"})
+
+        hashes = load_processed_key_hashes(output_path)
+        assert key_hash("key1") in hashes
+        assert key_hash("key2") not in hashes
+
+    def test_missing_sidecar_falls_back_to_scan(self, tmp_path):
+        """Test the full-record scan path for outputs without a sidecar."""
+        output_path = tmp_path / "output.jsonl"
+        with JsonlWriter(output_path) as writer:
+            writer.write({"page_key": "key1"})
+            writer.note_key_hash(key_hash("key1"))
+        output_path.with_suffix(".keys").unlink()
+
+        assert load_processed_key_hashes(output_path) == {key_hash("key1")}
+
+    def test_discard_stale_sidecar(self, tmp_path):
+        """Test that a sidecar without its JSONL is removed, others kept."""
+        output_path = tmp_path / "output.jsonl"
+        sidecar = output_path.with_suffix(".keys")
+        sidecar.write_bytes(b"\x01" * 16)
+
+        discard_stale_sidecar(output_path)
+        assert not sidecar.exists()
+
+        append_record(output_path, {"page_key": "key1"})
+        sidecar.write_bytes(b"\x01" * 16)
+        discard_stale_sidecar(output_path)
+        assert sidecar.exists()
+
+
+class TestJsonlWriter:
+    """Tests for the JsonlWriter checkpointing append writer."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that written records parse back in order."""
+        output_path = tmp_path / "output.jsonl"
+        with JsonlWriter(output_path) as writer:
+            writer.write({"page_key": "key1", "n": 1})
+            writer.write_many([{"page_key": "key2"}, {"page_key": "key3"}])
+
+        lines = output_path.read_bytes().splitlines()
+        assert [json.loads(line)["page_key"] for line in lines] == [
+            "key1",
+            "key2",
+            "key3",
+        ]
+
+    def test_checkpoint_makes_records_visible_before_close(self, tmp_path):
+        """Test that a count-triggered checkpoint writes staged records out."""
+        output_path = tmp_path / "output.jsonl"
+        with JsonlWriter(output_path, checkpoint_every=2) as writer:
+            writer.write({"page_key": "key1"})
+            writer.write({"page_key": "key2"})
+            # Second write crossed checkpoint_every: both lines on disk.
+            assert len(output_path.read_bytes().splitlines()) == 2
+            writer.write({"page_key": "key3"})
+
+        assert len(output_path.read_bytes().splitlines()) == 3
+
+    def test_appends_to_existing_output(self, tmp_path):
+        """Test that a second writer run appends rather than overwrites."""
+        output_path = tmp_path / "output.jsonl"
+        with JsonlWriter(output_path) as writer:
+            writer.write({"page_key": "key1"})
+        with JsonlWriter(output_path) as writer:
+            writer.write({"page_key": "key2"})
+
+        assert len(output_path.read_bytes().splitlines()) == 2
+
+
+class TestIterRecords:
+    """Tests for the iter_records() streaming reader."""
+
+    def test_streams_records_in_order(self, tmp_path):
+        """Test that records come back as dicts in file order."""
+        output_path = tmp_path / "output.jsonl"
+        for k in ("key1", "key2", "key3"):
+            append_record(output_path, {"page_key": k})
+
+        assert [r["page_key"] for r in iter_records(output_path)] == [
+            "key1",
+            "key2",
+            "key3",
+        ]
+
+    def test_skips_invalid_and_truncated_lines(self, tmp_path):
+        """Test that bad lines are skipped, matching the resume scan."""
+        output_path = tmp_path / "output.jsonl"
+        append_record(output_path, {"page_key": "key1"})
+        with output_path.open("ab") as f:
+            f.write(b"invalid json line\n")
+            f.write(b'{"page_key": "key2"}\n')
+            f.write(b'{"page_key": "trunc')  # partial last line
+
+        assert [r["page_key"] for r in iter_records(output_path)] == [
+            "key1",
+            "key2",
+        ]
+
+    def test_missing_file_yields_nothing(self, tmp_path):
+        """Test that a nonexistent file iterates as empty."""
+        assert list(iter_records(tmp_path / "missing.jsonl")) == []
+
+
 class TestLoadProcessedKeys:
     """Tests for load_processed_keys() function."""
 
-    def test_load_from_nonexistent_file(self):
+    def test_load_from_nonexistent_file(self, tmp_path):
         """Test that loading from nonexistent file returns empty set."""
-        nonexistent = Path("/tmp/does_not_exist_12345.jsonl")
+        nonexistent = tmp_path / "does_not_exist.jsonl"
         processed = load_processed_keys(nonexistent)
         assert processed == set()
 
-    def test_load_from_empty_file(self):
+    def test_load_from_empty_file(self, tmp_path):
         """Test that loading from empty file returns empty set."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "empty.jsonl"
+        temp_path.touch()
 
-        try:
-            processed = load_processed_keys(temp_path)
-            assert processed == set()
-        finally:
-            temp_path.unlink()
+        processed = load_processed_keys(temp_path)
+        assert processed == set()
 
-    def test_load_from_file_with_records(self):
+    def test_load_from_file_with_records(self, tmp_path):
         """Test loading page keys from JSONL file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
-            # Write some test records
-            json.dump({"page_key": "key1", "text": "..."}, f)
-            f.write("\n")
-            json.dump({"page_key": "key2", "text": "..."}, f)
-            f.write("\n")
-            json.dump({"page_key": "key3", "text": "..."}, f)
-            f.write("\n")
-            temp_path = Path(f.name)
-
-        try:
-            processed = load_processed_keys(temp_path)
-            assert len(processed) == 3
-            assert "key1" in processed
-            assert "key2" in processed
-            assert "key3" in processed
-        finally:
-            temp_path.unlink()
-
-    def test_load_ignores_invalid_lines(self):
+        temp_path = tmp_path / "records.jsonl"
+        temp_path.write_text(
+            json.dumps({"page_key": "key1", "text": "..."}) + "\n"
+            + json.dumps({"page_key": "key2", "text": "..."}) + "\n"
+            + json.dumps({"page_key": "key3", "text": "..."}) + "\n"
+        )
+
+        processed = load_processed_keys(temp_path)
+        assert len(processed) == 3
+        assert "key1" in processed
+        assert "key2" in processed
+        assert "key3" in processed
+
+    def test_load_ignores_invalid_lines(self, tmp_path):
         """Test that invalid JSON lines are ignored."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
-            json.dump({"page_key": "key1"}, f)
-            f.write("\n")
-            f.write("invalid json line\n")
-            json.dump({"page_key": "key2"}, f)
-            f.write("\n")
-            temp_path = Path(f.name)
-
-        try:
-            processed = load_processed_keys(temp_path)
-            assert len(processed) == 2
-            assert "key1" in processed
-            assert "key2" in processed
-        finally:
-            temp_path.unlink()
-
-    def test_load_ignores_records_without_page_key(self):
+        temp_path = tmp_path / "mixed.jsonl"
+        temp_path.write_text(
+            json.dumps({"page_key": "key1"}) + "\n"
+            + "invalid json line\n"
+            + json.dumps({"page_key": "key2"}) + "\n"
+        )
+
+        processed = load_processed_keys(temp_path)
+        assert len(processed) == 2
+        assert "key1" in processed
+        assert "key2" in processed
+
+    def test_load_ignores_records_without_page_key(self, tmp_path):
         """Test that records without page_key field are ignored."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
-            json.dump({"page_key": "key1"}, f)
-            f.write("\n")
-            json.dump({"text": "no key here"}, f)
-            f.write("\n")
-            json.dump({"page_key": "key2"}, f)
-            f.write("\n")
-            temp_path = Path(f.name)
-
-        try:
-            processed = load_processed_keys(temp_path)
-            assert len(processed) == 2
-            assert "key1" in processed
-            assert "key2" in processed
-        finally:
-            temp_path.unlink()
+        temp_path = tmp_path / "partial.jsonl"
+        temp_path.write_text(
+            json.dumps({"page_key": "key1"}) + "\n"
+            + json.dumps({"text": "no key here"}) + "\n"
+            + json.dumps({"page_key": "key2"}) + "\n"
+        )
+
+        processed = load_processed_keys(temp_path)
+        assert len(processed) == 2
+        assert "key1" in processed
+        assert "key2" in processed
 
 
 class TestAppendRecord:
     """Tests for append_record() function."""
 
-    def test_append_record_creates_file(self):
+    def test_append_record_creates_file(self, tmp_path):
         """Test that append_record creates file if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.jsonl"
-            record = {"page_key": "test_key", "text": "test text"}
+        output_path = tmp_path / "output.jsonl"
+        record = {"page_key": "test_key", "text": "test text"}
 
-            append_record(output_path, record)
+        append_record(output_path, record)
 
-            assert output_path.exists()
+        assert output_path.exists()
 
-    def test_append_record_creates_parent_dirs(self):
+    def test_append_record_creates_parent_dirs(self, tmp_path):
         """Test that append_record creates parent directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "subdir" / "output.jsonl"
-            record = {"page_key": "test_key"}
+        output_path = tmp_path / "subdir" / "output.jsonl"
+        record = {"page_key": "test_key"}
 
-            append_record(output_path, record)
+        append_record(output_path, record)
 
-            assert output_path.exists()
-            assert output_path.parent.exists()
+        assert output_path.exists()
+        assert output_path.parent.exists()
 
-    def test_append_record_writes_json(self):
+    def test_append_record_writes_json(self, tmp_path):
         """Test that append_record writes valid JSON."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            record = {"page_key": "test_key", "text": "test text", "number": 42}
-            append_record(temp_path, record)
+        temp_path = tmp_path / "output.jsonl"
+        record = {"page_key": "test_key", "text": "test text", "number": 42}
+        append_record(temp_path, record)
 
-            # Read and parse the JSON
-            with temp_path.open() as f:
-                line = f.readline().strip()
-                parsed = json.loads(line)
+        # Read and parse the JSON
+        with temp_path.open() as f:
+            line = f.readline().strip()
+            parsed = json.loads(line)
 
-            assert parsed == record
-        finally:
-            temp_path.unlink()
+        assert parsed == record
 
-    def test_append_record_appends_not_overwrites(self):
+    def test_append_record_appends_not_overwrites(self, tmp_path):
         """Test that append_record appends to existing file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            # Append multiple records
-            append_record(temp_path, {"page_key": "key1"})
-            append_record(temp_path, {"page_key": "key2"})
-            append_record(temp_path, {"page_key": "key3"})
-
-            # Read all lines
-            with temp_path.open() as f:
-                lines = f.readlines()
-
-            assert len(lines) == 3
-            assert json.loads(lines[0])["page_key"] == "key1"
-            assert json.loads(lines[1])["page_key"] == "key2"
-            assert json.loads(lines[2])["page_key"] == "key3"
-        finally:
-            temp_path.unlink()
+        temp_path = tmp_path / "output.jsonl"
+
+        # Append multiple records
+        append_record(temp_path, {"page_key": "key1"})
+        append_record(temp_path, {"page_key": "key2"})
+        append_record(temp_path, {"page_key": "key3"})
+
+        # Read all lines
+        with temp_path.open() as f:
+            lines = f.readlines()
+
+        assert len(lines) == 3
+        assert json.loads(lines[0])["page_key"] == "key1"
+        assert json.loads(lines[1])["page_key"] == "key2"
+        assert json.loads(lines[2])["page_key"] == "key3"